@@ -2,6 +2,8 @@
 Content enhancement node for LangGraph workflow.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from loguru import logger
 
 from ...domain.models import WorkflowState
@@ -18,6 +20,9 @@ from ...infrastructure.logging_utils import (
     resolve_total_steps,
 )
 
+# Below this length there is too little material for a useful executive summary
+MIN_SUMMARY_CHARS = 500
+
 
 def enhance_content_node(state: WorkflowState) -> WorkflowState:
     """
@@ -96,33 +101,46 @@ def enhance_content_node(state: WorkflowState) -> WorkflowState:
             return sum(1 for line in lines if line.startswith(("-", "•")))
         return 0
 
-    # Generate executive summary
-    if not structured.get("executive_summary"):
-        log_subsection("Generating Executive Summary")
-        executive_summary = llm.generate_executive_summary(markdown)
-        if executive_summary:
-            structured["executive_summary"] = executive_summary
-            summary_points = _count_summary_points(executive_summary)
-            log_metric("Summary Points", summary_points)
-            enhancements_added.append(f"{summary_points} summary points")
-
-    # Generate slide structure for PPTX and PDF-from-PPTX
-    if output_format in ("pptx", "pdf_from_pptx") and not structured.get("slides"):
-        log_subsection("Generating Slide Structure")
-        max_slides = metadata.get("max_slides")
-        max_attempts = max(1, int(metadata.get("slide_generation_retries", 0) or settings.generator.max_retries))
+    need_summary = len(markdown) >= MIN_SUMMARY_CHARS and not structured.get("executive_summary")
+    need_slides = output_format in ("pptx", "pdf_from_pptx") and not structured.get("slides")
+
+    # Summary and slide structure are independent requests over the same
+    # markdown, so overlap the summary with the slide attempts
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        summary_future = None
+        if len(markdown) < MIN_SUMMARY_CHARS:
+            log_progress("Content too short - skipping executive summary")
+        elif need_summary:
+            log_subsection("Generating Executive Summary")
+            summary_future = executor.submit(llm.generate_executive_summary, markdown)
+
+        # Generate slide structure for PPTX and PDF-from-PPTX
         slides = []
+        if need_slides:
+            log_subsection("Generating Slide Structure")
+            max_slides = metadata.get("max_slides")
+            max_attempts = max(1, int(metadata.get("slide_generation_retries", 0) or settings.generator.max_retries))
+
+            for attempt in range(1, max_attempts + 1):
+                slides = llm.generate_slide_structure(markdown, max_slides=max_slides)
+                if slides:
+                    break
+                log_progress(f"Slide generation attempt {attempt} failed")
 
-        for attempt in range(1, max_attempts + 1):
-            slides = llm.generate_slide_structure(markdown, max_slides=max_slides)
-            if slides:
-                structured["slides"] = slides
-                log_metric("Slides Generated", len(slides))
-                enhancements_added.append(f"{len(slides)} slides")
-                break
-            log_progress(f"Slide generation attempt {attempt} failed")
+        if summary_future is not None:
+            executive_summary = summary_future.result()
+            if executive_summary:
+                structured["executive_summary"] = executive_summary
+                summary_points = _count_summary_points(executive_summary)
+                log_metric("Summary Points", summary_points)
+                enhancements_added.append(f"{summary_points} summary points")
 
-        if not slides and require_slide_llm:
+    if need_slides:
+        if slides:
+            structured["slides"] = slides
+            log_metric("Slides Generated", len(slides))
+            enhancements_added.append(f"{len(slides)} slides")
+        elif require_slide_llm:
             error_msg = f"Slide generation failed after {max_attempts} attempts"
             state["errors"].append(error_msg)
             log_node_end("enhance_content", success=False, details=error_msg)
@@ -44,6 +44,10 @@ def generate_output_node(state: WorkflowState) -> WorkflowState:
     try:
         # Get appropriate generator
         output_format = state["output_format"]
+        metadata = state["metadata"]
+        structured_content = state["structured_content"]
+        input_path = state.get("input_path", "")
+        settings = get_settings()
         log_metric("Output Format", output_format.upper())
         
         generator = get_generator(output_format)
@@ -55,19 +59,17 @@ def generate_output_node(state: WorkflowState) -> WorkflowState:
             log_progress(f"Using custom output path")
             custom_path = Path(custom_output_path)
             output_dir = custom_path.parent
-            state["metadata"]["custom_filename"] = custom_path.stem
+            metadata["custom_filename"] = custom_path.stem
             output_path = generator.generate(
-                content=state["structured_content"],
-                metadata=state["metadata"],
+                content=structured_content,
+                metadata=metadata,
                 output_dir=output_dir
             )
         else:
             log_progress("Determining output directory")
-            settings = get_settings()
 
-            folder_name = state["metadata"].get("custom_filename") or state["metadata"].get("file_id")
+            folder_name = metadata.get("custom_filename") or metadata.get("file_id")
             if not folder_name:
-                input_path = state.get("input_path", "")
                 if input_path:
                     input_p = Path(input_path)
                     for part in input_p.parts:
@@ -88,8 +90,8 @@ def generate_output_node(state: WorkflowState) -> WorkflowState:
 
             log_progress(f"Generating {output_format.upper()} document")
             output_path = generator.generate(
-                content=state["structured_content"],
-                metadata=state["metadata"],
+                content=structured_content,
+                metadata=metadata,
                 output_dir=topic_output_dir
             )
 
@@ -98,18 +100,15 @@ def generate_output_node(state: WorkflowState) -> WorkflowState:
         file_size = Path(output_path).stat().st_size
         log_file_operation("write", str(output_path), file_size)
 
-        metadata = state.get("metadata", {})
         if "cache_content" in metadata:
             cache_content = metadata.get("cache_content", False)
         else:
-            settings = get_settings()
             cache_content = settings.generator.reuse_cache_by_default
 
         if cache_content:
             from ...utils.content_cache import save_structured_content
-            input_path = state.get("input_path", "")
             if input_path:
-                save_structured_content(state["structured_content"], input_path)
+                save_structured_content(structured_content, input_path)
                 log_progress("Cached structured content")
 
         log_node_end("generate_output", success=True, 
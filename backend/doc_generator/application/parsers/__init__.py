@@ -4,6 +4,8 @@ Parsers for different input formats.
 Provides factory function to get appropriate parser for content format.
 """
 
+from functools import lru_cache
+
 from ...domain.content_types import ContentFormat
 from ...domain.exceptions import UnsupportedFormatError
 from .markdown_parser import MarkdownParser
@@ -11,6 +13,40 @@ from .unified_parser import UnifiedParser
 from .web_parser import WebParser
 
 
+# Lowercased format name (including aliases) -> parser class
+_PARSERS = {
+    # Markdown files
+    ContentFormat.MARKDOWN.value: MarkdownParser,
+    "markdown": MarkdownParser,
+    # Web URLs
+    ContentFormat.URL.value: WebParser,
+    ContentFormat.HTML.value: WebParser,
+    # Documents handled by unified parser (PDF, DOCX, PPTX, images)
+    ContentFormat.PDF.value: UnifiedParser,
+    ContentFormat.DOCX.value: UnifiedParser,
+    ContentFormat.PPTX.value: UnifiedParser,
+    "png": UnifiedParser,
+    "jpg": UnifiedParser,
+    "jpeg": UnifiedParser,
+    "tiff": UnifiedParser,
+    # Plain text (treat as markdown)
+    ContentFormat.TEXT.value: MarkdownParser,
+    "text": MarkdownParser,
+}
+
+
+@lru_cache(maxsize=None)
+def _shared_parser(parser_cls: type):
+    """
+    Return the process-wide instance of a parser class.
+
+    Parsers keep no per-call state, so one instance per class is reused and
+    its setup (settings lookup, availability probes) runs once.
+    Invoked by: src/doc_generator/application/parsers/__init__.py
+    """
+    return parser_cls()
+
+
 def get_parser(content_format: str):
     """
     Get appropriate parser for content format.
@@ -19,31 +55,16 @@ def get_parser(content_format: str):
         content_format: Content format (pdf, md, txt, url, etc.)
 
     Returns:
-        Parser instance
+        Shared parser instance
 
     Raises:
         UnsupportedFormatError: If format is not supported
     Invoked by: scripts/generate_from_folder.py, src/doc_generator/application/nodes/parse_content.py, src/doc_generator/application/workflow/nodes/parse_content.py, src/doc_generator/infrastructure/api/services/generation.py
     """
-    format_lower = content_format.lower()
-
-    # Markdown files
-    if format_lower in ["md", "markdown", ContentFormat.MARKDOWN]:
-        return MarkdownParser()
-
-    # Web URLs
-    if format_lower in ["url", "html", ContentFormat.URL, ContentFormat.HTML]:
-        return WebParser()
-
-    # Documents handled by unified parser (PDF, DOCX, PPTX, images)
-    if format_lower in ["pdf", "docx", "pptx", "png", "jpg", "jpeg", "tiff"]:
-        return UnifiedParser()
-
-    # Plain text (treat as markdown)
-    if format_lower in ["txt", "text", ContentFormat.TEXT]:
-        return MarkdownParser()
-
-    raise UnsupportedFormatError(f"Unsupported content format: {content_format}")
+    parser_cls = _PARSERS.get(content_format.lower())
+    if parser_cls is None:
+        raise UnsupportedFormatError(f"Unsupported content format: {content_format}")
+    return _shared_parser(parser_cls)
 
 
 __all__ = ["UnifiedParser", "MarkdownParser", "WebParser", "get_parser"]
@@ -4,14 +4,72 @@ Direct markdown file parser.
 Parses markdown files with frontmatter support (Hugo-style).
 """
 
+import os
 from pathlib import Path
 from typing import Tuple
 
 from loguru import logger
 
 from ...domain.exceptions import ParseError
-from ...infrastructure.parsers.file_system import read_text_file, validate_file_exists
-from ...utils.markdown_utils import extract_frontmatter, strip_frontmatter
+from ...infrastructure.parsers.file_system import validate_file_exists
+from ...utils.markdown_utils import extract_and_strip_frontmatter, locate_frontmatter
+
+# Frontmatter is looked for in this leading chunk before the body is read
+_HEADER_READ_SIZE = 4096
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _decode(data: bytes) -> str:
+    """
+    Decode UTF-8 file bytes and normalize line endings to LF.
+
+    Strict like read_text_file: invalid bytes raise UnicodeDecodeError,
+    which parse() reports as a ParseError.
+    Invoked by: src/doc_generator/application/parsers/markdown_parser.py
+    """
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_with_frontmatter(path: Path) -> Tuple[dict, str]:
+    """
+    Read a markdown file and split off its frontmatter.
+
+    Frontmatter is resolved from the leading chunk of the file; the file is
+    then repositioned at the body, which is decoded in one piece and never
+    copied out of a full-document string. Line endings are normalized the
+    same way as read_text_file.
+
+    Args:
+        path: Path to markdown file
+
+    Returns:
+        Tuple of (frontmatter metadata, markdown body)
+    Invoked by: src/doc_generator/application/parsers/markdown_parser.py
+    """
+    with open(path, "rb") as handle:
+        # Extend to a line boundary so a closing delimiter (or a multi-byte
+        # character) is never cut off
+        raw = handle.read(_HEADER_READ_SIZE) + handle.readline()
+        start = len(_UTF8_BOM) if raw.startswith(_UTF8_BOM) else 0
+        header = raw[start:].decode("utf-8")
+        metadata, body_start = {}, 0
+        # A bare CR only ends a line once normalized; such files take the
+        # full read below
+        if "\r" not in header.replace("\r\n", ""):
+            metadata, body_start = locate_frontmatter(header)
+
+        if not body_start:
+            # No frontmatter in the header (absent or longer than the chunk)
+            handle.seek(start)
+            return extract_and_strip_frontmatter(_decode(handle.read()))
+        if body_start == len(header):
+            # Whitespace after the frontmatter may run past the header
+            return metadata, _decode(handle.read()).lstrip()
+        handle.seek(start + len(header[:body_start].encode("utf-8")))
+        return metadata, _decode(handle.read())
 
 
 class MarkdownParser:
@@ -35,35 +93,31 @@ class MarkdownParser:
             ParseError: If parsing fails
         Invoked by: .claude/skills/pptx/ooxml/scripts/pack.py, .claude/skills/pptx/ooxml/scripts/validation/base.py, .claude/skills/pptx/ooxml/scripts/validation/docx.py, .claude/skills/pptx/ooxml/scripts/validation/pptx.py, .claude/skills/pptx/ooxml/scripts/validation/redlining.py, scripts/generate_from_folder.py, src/doc_generator/application/nodes/parse_content.py, src/doc_generator/application/workflow/nodes/parse_content.py, src/doc_generator/infrastructure/api/services/generation.py
         """
-        path = Path(input_path)
+        path = input_path if isinstance(input_path, Path) else Path(input_path)
+        source_file = input_path if isinstance(input_path, str) else os.fspath(path)
 
         try:
             validate_file_exists(path)
         except Exception as e:
             raise ParseError(f"Failed to access markdown file: {e}")
 
-        logger.info(f"Parsing markdown file: {path.name}")
+        logger.info("Parsing markdown file: {}", path.name)
 
         try:
-            content = read_text_file(path)
-
-            # Extract frontmatter using shared utility
-            metadata = extract_frontmatter(content)
-            metadata["source_file"] = str(path)
+            # Extract frontmatter from the file header, then read the body
+            metadata, content = _read_with_frontmatter(path)
+            metadata["source_file"] = source_file
             metadata["parser"] = "markdown"
 
             # Use filename as fallback title
-            if "title" not in metadata:
-                metadata["title"] = path.stem
-
-            logger.debug(f"Extracted frontmatter: {metadata}")
+            metadata.setdefault("title", path.stem)
 
-            # Remove frontmatter from content using shared utility
-            content = strip_frontmatter(content)
+            logger.debug("Extracted frontmatter: {}", metadata)
 
             logger.info(
-                f"Markdown parsing completed: {len(content)} chars, "
-                f"title='{metadata.get('title', 'N/A')}'"
+                "Markdown parsing completed: {} chars, title='{}'",
+                len(content),
+                metadata.get("title", "N/A"),
             )
 
             return content, metadata
@@ -5,8 +5,12 @@ Handles PDF, DOCX, PPTX, and images with markdown conversion.
 Falls back to lighter parsers (pypdf, python-docx) when MarkItDown is unavailable.
 """
 
+import hashlib
+import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from loguru import logger
 
@@ -15,6 +19,30 @@ from ...infrastructure.parsers.markitdown import (
     convert_to_markdown,
     is_markitdown_available,
 )
+from ...infrastructure.settings import get_settings
+from .markdown_parser import MarkdownParser
+
+# Already-markdown inputs need no conversion and go straight to MarkdownParser
+_MARKDOWN_SUFFIXES = frozenset({".md", ".markdown", ".txt"})
+
+# Parse results kept on disk; the least recently written beyond this are pruned
+_PARSE_CACHE_MAX_ENTRIES = 256
+
+
+@lru_cache(maxsize=1)
+def _markitdown_ok() -> bool:
+    """
+    Probe MarkItDown availability once per process.
+
+    Also emits the fallback warning once instead of on every parser instance.
+    Invoked by: src/doc_generator/application/parsers/unified_parser.py
+    """
+    available = is_markitdown_available()
+    if not available:
+        logger.warning(
+            "MarkItDown not available - will use fallback parsers (pypdf, python-docx)"
+        )
+    return available
 
 
 class UnifiedParser:
@@ -29,18 +57,28 @@ class UnifiedParser:
     - PPTX: python-pptx
     """
 
-    def __init__(self):
-        """Initialize parser and check MarkItDown availability."""
-        self._markitdown_available = is_markitdown_available()
-        if not self._markitdown_available:
-            logger.warning(
-                "MarkItDown not available - will use fallback parsers (pypdf, python-docx)"
-            )
+    def __init__(self, cache_dir: Path | None = None):
+        """
+        Initialize parser and check MarkItDown availability.
+
+        Args:
+            cache_dir: Directory for cached parse results
+                (defaults to <generator.cache_dir>/parsed)
+        """
+        self._markitdown_available = _markitdown_ok()
+        self._markdown_parser = MarkdownParser()
+        if cache_dir is None:
+            cache_dir = get_settings().generator.cache_dir / "parsed"
+        self._cache_dir = cache_dir
 
     def parse(self, input_path: str | Path) -> Tuple[str, dict]:
         """
         Parse document using MarkItDown or fallback parsers.
 
+        Results are cached on disk keyed by a hash of the file's contents, so
+        the same document is only converted once, whatever path it is
+        uploaded under.
+
         Args:
             input_path: Path to input file
 
@@ -55,15 +93,33 @@ class UnifiedParser:
         if not path.exists():
             raise ParseError(f"File not found: {path}")
 
-        suffix = path.suffix.lower()
+        if path.suffix.lower() in _MARKDOWN_SUFFIXES:
+            return self._markdown_parser.parse(path)
+
+        cache_file = self._cache_file(path)
+        cached = self._load_cached(cache_file)
+        if cached is not None:
+            logger.info("Using cached parse result: {}", path.name)
+            content, metadata = cached
+            # The cached entry may come from the same bytes under another path
+            metadata["title"] = path.stem
+            metadata["source_file"] = str(path)
+            return content, metadata
 
+        content, metadata = self._parse_uncached(path)
+        self._store_cached(cache_file, content, metadata)
+        return content, metadata
+
+    def _parse_uncached(self, path: Path) -> Tuple[str, dict]:
+        """Parse document without consulting the parse cache."""
         # Use MarkItDown if available
         if self._markitdown_available:
             return self._parse_with_markitdown(path)
 
         # Fallback parsers based on file type
-        logger.info(f"Using fallback parser for: {path.name}")
+        logger.info("Using fallback parser for: {}", path.name)
 
+        suffix = path.suffix.lower()
         if suffix == ".pdf":
             return self._parse_pdf_fallback(path)
         elif suffix == ".docx":
@@ -80,9 +136,59 @@ class UnifiedParser:
                 "Install MarkItDown for document parsing: pip install markitdown[all]"
             )
 
+    def _cache_file(self, path: Path) -> Path:
+        """Build the cache file path from the file's content hash and type."""
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+        return self._cache_dir / f"{digest.hexdigest()}{path.suffix.lower()}.json"
+
+    def _load_cached(self, cache_file: Path) -> Optional[Tuple[str, dict]]:
+        """Load a cached parse result, or None on miss."""
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data["content"], data["metadata"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable parse cache {}: {}", cache_file.name, e)
+            return None
+
+    def _store_cached(self, cache_file: Path, content: str, metadata: dict) -> None:
+        """Write a parse result to the cache atomically."""
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"content": content, "metadata": metadata}, f, ensure_ascii=False)
+            os.replace(tmp_file, cache_file)
+            self._prune_cache()
+        except Exception as e:
+            logger.warning(f"Failed to cache parse result: {e}")
+
+    def _prune_cache(self) -> None:
+        """Delete the oldest cached parse results beyond _PARSE_CACHE_MAX_ENTRIES."""
+        entries = []
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    continue
+        if len(entries) <= _PARSE_CACHE_MAX_ENTRIES:
+            return
+        entries.sort()
+        for _, stale_path in entries[: len(entries) - _PARSE_CACHE_MAX_ENTRIES]:
+            try:
+                os.unlink(stale_path)
+            except OSError:
+                pass
+
     def _parse_with_markitdown(self, path: Path) -> Tuple[str, dict]:
         """Parse using MarkItDown."""
-        logger.info(f"Parsing with MarkItDown: {path.name}")
+        logger.info("Parsing with MarkItDown: {}", path.name)
         try:
             content = convert_to_markdown(path)
             metadata = {
@@ -90,7 +196,7 @@ class UnifiedParser:
                 "source_file": str(path),
                 "parser": "markitdown",
             }
-            logger.info(f"MarkItDown parsing completed: {len(content)} chars")
+            logger.info("MarkItDown parsing completed: {} chars", len(content))
             return content, metadata
         except Exception as e:
             logger.error(f"MarkItDown parsing failed for {path}: {e}")
@@ -103,7 +209,7 @@ class UnifiedParser:
         except ImportError:
             raise ParseError("pypdf not installed. Run: pip install pypdf")
 
-        logger.info(f"Parsing PDF with pypdf (fallback): {path.name}")
+        logger.info("Parsing PDF with pypdf (fallback): {}", path.name)
 
         try:
             reader = PdfReader(str(path))
@@ -124,7 +230,9 @@ class UnifiedParser:
             }
 
             logger.info(
-                f"pypdf parsing completed: {len(content)} chars, {len(reader.pages)} pages"
+                "pypdf parsing completed: {} chars, {} pages",
+                len(content),
+                len(reader.pages),
             )
             return content, metadata
 
@@ -139,7 +247,7 @@ class UnifiedParser:
         except ImportError:
             raise ParseError("python-docx not installed. Run: pip install python-docx")
 
-        logger.info(f"Parsing DOCX with python-docx (fallback): {path.name}")
+        logger.info("Parsing DOCX with python-docx (fallback): {}", path.name)
 
         try:
             doc = Document(str(path))
@@ -176,7 +284,7 @@ class UnifiedParser:
                 "tables": len(doc.tables),
             }
 
-            logger.info(f"python-docx parsing completed: {len(content)} chars")
+            logger.info("python-docx parsing completed: {} chars", len(content))
             return content, metadata
 
         except Exception as e:
@@ -190,7 +298,7 @@ class UnifiedParser:
         except ImportError:
             raise ParseError("python-pptx not installed. Run: pip install python-pptx")
 
-        logger.info(f"Parsing PPTX with python-pptx (fallback): {path.name}")
+        logger.info("Parsing PPTX with python-pptx (fallback): {}", path.name)
 
         try:
             prs = Presentation(str(path))
@@ -215,7 +323,9 @@ class UnifiedParser:
             }
 
             logger.info(
-                f"python-pptx parsing completed: {len(content)} chars, {len(prs.slides)} slides"
+                "python-pptx parsing completed: {} chars, {} slides",
+                len(content),
+                len(prs.slides),
             )
             return content, metadata
 
@@ -7,7 +7,7 @@ Defines Pydantic models for workflow state, configuration, and content structure
 from pathlib import Path
 from typing import TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .content_types import ImageType, OutputFormat
 
@@ -55,8 +55,7 @@ class GeneratorConfig(BaseModel):
     default_output_format: OutputFormat = Field(default=OutputFormat.PDF)
     max_retries: int = Field(default=3, ge=1, le=5)
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class ContentSection(BaseModel):
@@ -69,6 +68,8 @@ class ContentSection(BaseModel):
         metadata: Additional metadata for the section
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: str
     text: str
     metadata: dict = Field(default_factory=dict)
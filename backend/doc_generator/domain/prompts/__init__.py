@@ -2,38 +2,94 @@
 Prompt templates for LLM-powered document generation.
 
 Exports prompt templates used by LLM content, image generation, and services.
+Re-exports are resolved lazily on first access (PEP 562), so importing a
+single prompt submodule does not load every prompt template.
 """
 
-from .image import (
-    CONCEPT_EXTRACTION_PROMPT,
-    CONCEPT_EXTRACTION_SYSTEM_PROMPT,
-    CONTENT_AWARE_IMAGE_PROMPT,
-    IMAGE_DESCRIPTION_PROMPT,
-    IMAGE_STYLE_TEMPLATES,
-    build_gemini_image_prompt,
-    build_image_description_prompt,
-    build_prompt_generator_prompt,
-)
-from .text import (
-    build_blog_from_outline_prompt,
-    build_chunk_prompt,
-    build_generation_prompt,
-    build_outline_prompt,
-    build_title_prompt,
-    enhance_bullets_prompt,
-    enhance_bullets_system_prompt,
-    executive_summary_prompt,
-    executive_summary_system_prompt,
-    get_content_system_prompt,
-    section_slide_structure_prompt,
-    section_slide_structure_system_prompt,
-    slide_structure_prompt,
-    slide_structure_system_prompt,
-    speaker_notes_prompt,
-    speaker_notes_system_prompt,
-    visualization_suggestions_prompt,
-    visualization_suggestions_system_prompt,
-)
+from importlib import import_module
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .image import (
+        CONCEPT_EXTRACTION_PROMPT,
+        CONCEPT_EXTRACTION_SYSTEM_PROMPT,
+        CONTENT_AWARE_IMAGE_PROMPT,
+        IMAGE_DESCRIPTION_PROMPT,
+        IMAGE_STYLE_TEMPLATES,
+        build_gemini_image_prompt,
+        build_image_description_prompt,
+        build_prompt_generator_prompt,
+    )
+    from .text import (
+        build_blog_from_outline_prompt,
+        build_chunk_prompt,
+        build_generation_prompt,
+        build_outline_prompt,
+        build_title_prompt,
+        enhance_bullets_prompt,
+        enhance_bullets_system_prompt,
+        executive_summary_prompt,
+        executive_summary_system_prompt,
+        get_content_system_prompt,
+        section_slide_structure_prompt,
+        section_slide_structure_system_prompt,
+        slide_structure_prompt,
+        slide_structure_system_prompt,
+        speaker_notes_prompt,
+        speaker_notes_system_prompt,
+        visualization_suggestions_prompt,
+        visualization_suggestions_system_prompt,
+    )
+
+# Read-only map of each re-exported name to the subpackage that defines it
+_LAZY_IMPORTS = MappingProxyType({
+    "CONCEPT_EXTRACTION_PROMPT": ".image",
+    "CONCEPT_EXTRACTION_SYSTEM_PROMPT": ".image",
+    "CONTENT_AWARE_IMAGE_PROMPT": ".image",
+    "IMAGE_DESCRIPTION_PROMPT": ".image",
+    "IMAGE_STYLE_TEMPLATES": ".image",
+    "build_gemini_image_prompt": ".image",
+    "build_image_description_prompt": ".image",
+    "build_prompt_generator_prompt": ".image",
+    "build_blog_from_outline_prompt": ".text",
+    "build_chunk_prompt": ".text",
+    "build_generation_prompt": ".text",
+    "build_outline_prompt": ".text",
+    "build_title_prompt": ".text",
+    "enhance_bullets_prompt": ".text",
+    "enhance_bullets_system_prompt": ".text",
+    "executive_summary_prompt": ".text",
+    "executive_summary_system_prompt": ".text",
+    "get_content_system_prompt": ".text",
+    "section_slide_structure_prompt": ".text",
+    "section_slide_structure_system_prompt": ".text",
+    "slide_structure_prompt": ".text",
+    "slide_structure_system_prompt": ".text",
+    "speaker_notes_prompt": ".text",
+    "speaker_notes_system_prompt": ".text",
+    "visualization_suggestions_prompt": ".text",
+    "visualization_suggestions_system_prompt": ".text",
+})
+
+
+def __getattr__(name: str):
+    """
+    Import a re-exported prompt on first access and cache it on the package.
+
+    Once cached in the module globals, later lookups never reach this hook.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "build_blog_from_outline_prompt",
@@ -4,6 +4,8 @@ Prompts for FAQ generation.
 Extracts Q&A pairs with tags from source content.
 """
 
+from string import Formatter
+
 FAQ_EXTRACTION_PROMPT = """You are an expert at creating FAQ documents from source content.
 
 Analyze the following content and extract relevant frequently asked questions with answers.
@@ -47,6 +49,17 @@ Guidance:
 Return ONLY valid JSON, no other text."""
 
 
+def _precompile(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a str.format template once into (literal, field_name) segments."""
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _spec, _conversion in Formatter().parse(template)
+    )
+
+
+_FAQ_EXTRACTION_SEGMENTS = _precompile(FAQ_EXTRACTION_PROMPT)
+
+
 def build_faq_extraction_prompt(
     content: str,
     faq_count: int,
@@ -68,11 +81,15 @@ def build_faq_extraction_prompt(
     Returns:
         Formatted prompt string
     """
-    return FAQ_EXTRACTION_PROMPT.format(
-        content=content,
-        faq_count=faq_count,
-        answer_format=answer_format,
-        detail_level=detail_level,
-        mode=mode,
-        audience=audience,
+    values = {
+        "content": content,
+        "faq_count": faq_count,
+        "answer_format": answer_format,
+        "detail_level": detail_level,
+        "mode": mode,
+        "audience": audience,
+    }
+    return "".join(
+        literal + (str(values[field]) if field is not None else "")
+        for literal, field in _FAQ_EXTRACTION_SEGMENTS
     )
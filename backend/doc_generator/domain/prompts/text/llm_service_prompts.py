@@ -2,6 +2,60 @@
 Prompt templates for LLM service operations.
 """
 
+# Repeats shorter than this (headings, "Pros:" labels) carry structure, not boilerplate
+_MIN_BOILERPLATE_CHARS = 80
+
+
+def _bullet_block(items: list[str]) -> str:
+    return "- " + "\n- ".join(items) if items else ""
+
+
+def _compact(content: str, limit: int) -> str:
+    """
+    Fit content into limit chars, keeping the highest-signal paragraphs.
+
+    Content within the limit is returned unchanged. Otherwise repeated
+    long paragraphs (running headers, licence blocks) are dropped first;
+    short ones such as headings and labels are always kept. If the rest
+    still overflows, the first and last paragraphs are kept and the
+    remaining budget goes to paragraphs with the most distinct words,
+    emitted in their original order instead of cutting at limit.
+    """
+    if len(content) <= limit:
+        return content
+
+    paragraphs = []
+    seen = set()
+    for paragraph in content.split("\n\n"):
+        key = " ".join(paragraph.split()).lower()
+        if not key:
+            continue
+        if len(key) >= _MIN_BOILERPLATE_CHARS:
+            if key in seen:
+                continue
+            seen.add(key)
+        paragraphs.append(paragraph)
+
+    compacted = "\n\n".join(paragraphs)
+    if len(compacted) <= limit or len(paragraphs) < 3:
+        return compacted[:limit]
+
+    keep = {0, len(paragraphs) - 1}
+    budget = limit - len(paragraphs[0]) - len(paragraphs[-1]) - 2
+    if budget < 0:
+        return compacted[:limit]
+
+    def _score(idx: int) -> float:
+        words = paragraphs[idx].lower().split()
+        return len(set(words)) / (1 + len(words))
+
+    for idx in sorted(range(1, len(paragraphs) - 1), key=lambda i: (-_score(i), i)):
+        cost = len(paragraphs[idx]) + 2
+        if cost <= budget:
+            keep.add(idx)
+            budget -= cost
+    return "\n\n".join(paragraphs[idx] for idx in sorted(keep))
+
 
 def executive_summary_system_prompt() -> str:
     return "You are an executive communication specialist who creates clear, impactful summaries for senior leadership."
@@ -19,7 +73,7 @@ Requirements:
 - Use ONLY information present in the content; do not add new facts or assumptions
 
 Content:
-{content[:8000]}
+{_compact(content, 8000)}
 
 Respond with ONLY the bullet points, no introduction or conclusion."""
 
@@ -47,7 +101,7 @@ Requirements:
 - Use ONLY information from the content; do not introduce new facts or examples
 
 Content:
-{content[:8000]}
+{_compact(content, 8000)}
 
 Respond in JSON format:
 {{
@@ -77,6 +131,7 @@ def section_slide_structure_prompt(sections: list[dict], max_slides: int) -> str
             f"Image hint: {image_hint or 'None'}\n"
             f"Content:\n{snippet}\n"
         )
+    section_text = "\n".join(section_blocks)
 
     return f"""Create a presentation outline aligned to the sections below.
 
@@ -94,7 +149,7 @@ Requirements:
 - Use ONLY information from each section; do not add new facts or examples
 
 Sections:
-{chr(10).join(section_blocks)}
+{section_text}
 
 Respond in JSON format:
 {{
@@ -123,7 +178,7 @@ Requirements:
 - Maintain the original meaning
 
 Bullet points:
-{chr(10).join(f'- {b}' for b in bullets)}
+{_bullet_block(bullets)}
 
 Respond with ONLY the enhanced bullet points, one per line, starting with "-"."""
 
@@ -137,7 +192,7 @@ def speaker_notes_prompt(slide_title: str, slide_content: list[str]) -> str:
 
 Slide Title: {slide_title}
 Content:
-{chr(10).join(f'- {c}' for c in slide_content)}
+{_bullet_block(slide_content)}
 
 Requirements:
 - 2-3 sentences providing context
@@ -147,6 +202,36 @@ Requirements:
 Respond with ONLY the speaker notes text."""
 
 
+# One canonical JSON skeleton per visualization type, joined once at import
+VISUAL_DATA_FORMATS = {
+    "architecture": """{
+  "components": [{"id": "1", "name": "Component Name", "layer": "frontend|backend|database|external|infrastructure"}],
+  "connections": [{"from": "1", "to": "2", "label": "connection type"}]
+}""",
+    "flowchart": """{
+  "nodes": [{"id": "1", "type": "start|end|process|decision", "text": "Node text"}],
+  "edges": [{"from": "1", "to": "2", "label": "optional label"}]
+}""",
+    "comparison_visual": """{
+  "items": ["Option A", "Option B"],
+  "categories": [{"name": "Category", "scores": [8, 6]}]
+}""",
+    "concept_map": """{
+  "concepts": [{"id": "1", "text": "Concept", "level": 0}],
+  "relationships": [{"from": "1", "to": "2", "label": "relates to"}]
+}""",
+    "mind_map": """{
+  "central": "Main Topic",
+  "branches": [{"text": "Branch 1", "children": ["Sub 1.1", "Sub 1.2"]}]
+}""",
+}
+
+_VISUAL_DATA_FORMATS_TEXT = "\n\n".join(
+    f"For {visual_type}:\n{data_format}"
+    for visual_type, data_format in VISUAL_DATA_FORMATS.items()
+)
+
+
 def visualization_suggestions_system_prompt() -> str:
     return (
         "You are a visual communication expert who creates clear, informative diagrams. "
@@ -165,7 +250,7 @@ Look for:
 5. Topic overviews with subtopics → mind_map
 
 Content:
-{content[:6000]}
+{_compact(content, 6000)}
 
 For each visualization opportunity (maximum {max_visuals}), provide structured data.
 IMPORTANT: Keep text labels short (max 20 characters) to prevent overlap.
@@ -177,34 +262,6 @@ Return JSON with "visualizations" array. Each visualization must have:
 
 Data formats:
 
-For architecture:
-{{
-  "components": [{{"id": "1", "name": "Component Name", "layer": "frontend|backend|database|external|infrastructure"}}],
-  "connections": [{{"from": "1", "to": "2", "label": "connection type"}}]
-}}
-
-For flowchart:
-{{
-  "nodes": [{{"id": "1", "type": "start|end|process|decision", "text": "Node text"}}],
-  "edges": [{{"from": "1", "to": "2", "label": "optional label"}}]
-}}
-
-For comparison_visual:
-{{
-  "items": ["Option A", "Option B"],
-  "categories": [{{"name": "Category", "scores": [8, 6]}}]
-}}
-
-For concept_map:
-{{
-  "concepts": [{{"id": "1", "text": "Concept", "level": 0}}],
-  "relationships": [{{"from": "1", "to": "2", "label": "relates to"}}]
-}}
-
-For mind_map:
-{{
-  "central": "Main Topic",
-  "branches": [{{"text": "Branch 1", "children": ["Sub 1.1", "Sub 1.2"]}}]
-}}
+{_VISUAL_DATA_FORMATS_TEXT}
 
 If no good visualization opportunities exist, return {{"visualizations": []}}"""
@@ -56,6 +56,10 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("==> PrismDocs API shutting down", flush=True)
+    if _routes_initialized:
+        from .services.idea_canvas import close_executor
+
+        close_executor()
 
 
 app = FastAPI(
@@ -1,5 +1,6 @@
 """Cache management routes."""
 
+import os
 import shutil
 from pathlib import Path
 
@@ -44,6 +45,32 @@ def get_project_dirs() -> list[Path]:
     return [d for d in OUTPUT_BASE.iterdir() if d.is_dir() and d.name.startswith("f_")]
 
 
+def get_cache_entries() -> list[os.DirEntry]:
+    """
+    Get cache entry files (*.json) with a single scandir pass.
+    Invoked by: src/doc_generator/infrastructure/api/routes/cache.py
+    """
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            return [e for e in it if e.name.endswith(".json") and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def clear_cache_entries() -> int:
+    """
+    Delete all cache entry files and return how many were removed.
+
+    Goes through the shared CacheService so its in-memory entries and
+    stats are dropped along with the files.
+    Invoked by: src/doc_generator/infrastructure/api/routes/cache.py
+    """
+    # Deferred like the routers in main; unified pulls in the generation stack
+    from .unified import get_cache_service
+
+    return get_cache_service().clear_all()["cleared_cache_entries"]
+
+
 def get_total_size(directory: Path) -> int:
     """
     Get total size of all files in directory recursively.
@@ -66,9 +93,14 @@ async def get_cache_stats() -> CacheStatsResponse:
     projects_count = len(project_dirs)
     projects_size = sum(get_total_size(d) for d in project_dirs)
     
-    cache_files = list(CACHE_DIR.glob("*.json")) if CACHE_DIR.exists() else []
-    cache_count = len(cache_files)
-    cache_size = sum(f.stat().st_size for f in cache_files if f.exists())
+    cache_entries = get_cache_entries()
+    cache_count = len(cache_entries)
+    cache_size = 0
+    for entry in cache_entries:
+        try:
+            cache_size += entry.stat().st_size
+        except OSError:
+            pass
     
     return CacheStatsResponse(
         projects_count=projects_count,
@@ -86,14 +118,7 @@ async def clear_cache() -> ClearResponse:
         Count of cleared items
     Invoked by: (no references found)
     """
-    cache_cleared = 0
-    if CACHE_DIR.exists():
-        for f in CACHE_DIR.glob("*.json"):
-            try:
-                f.unlink()
-                cache_cleared += 1
-            except OSError:
-                pass
+    cache_cleared = clear_cache_entries()
     
     logger.info(f"Cleared {cache_cleared} cache entries")
     
@@ -124,14 +149,7 @@ async def clear_all() -> ClearResponse:
             logger.warning(f"Failed to remove {project_dir}: {e}")
     
     # Clear cache
-    cache_cleared = 0
-    if CACHE_DIR.exists():
-        for f in CACHE_DIR.glob("*.json"):
-            try:
-                f.unlink()
-                cache_cleared += 1
-            except OSError:
-                pass
+    cache_cleared = clear_cache_entries()
 
     # Clear temp output directory
     temp_cleared = 0
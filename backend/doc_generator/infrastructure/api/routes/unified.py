@@ -7,6 +7,7 @@ automatic session management for content reuse across formats.
 
 import datetime
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncIterator
 
@@ -49,8 +50,9 @@ _cache_service: CacheService | None = None
 DEFAULT_INLINE_PREVIEW_BYTES = 8 * 1024 * 1024
 
 
+@lru_cache(maxsize=1)
 def _get_max_inline_preview_bytes() -> int:
-    """Return max bytes to include inline previews in responses."""
+    """Return max bytes to include inline previews in responses (read once per process)."""
     raw_value = os.getenv("DOCGEN_MAX_INLINE_PREVIEW_BYTES")
     if raw_value is None:
         return DEFAULT_INLINE_PREVIEW_BYTES
@@ -1,5 +1,7 @@
 """File upload route."""
 
+import asyncio
+
 from fastapi import APIRouter, File, UploadFile
 
 from ..schemas.responses import UploadResponse
@@ -45,17 +47,23 @@ async def upload_file(file: UploadFile = File(...)) -> UploadResponse:
     """
     storage = get_storage_service()
 
-    content = await file.read()
     # StorageService.save_upload: persist uploaded source and return file_id.
-    file_id = storage.save_upload(
-        content=content,
+    # The spooled upload is streamed to disk in chunks (never read whole into
+    # memory), in a worker thread so concurrent uploads don't block the loop.
+    await file.seek(0)
+    file_id = await asyncio.to_thread(
+        storage.save_upload,
+        content=file.file,
         filename=file.filename or "unknown",
         mime_type=file.content_type or "application/octet-stream",
     )
+    size = file.size
+    if size is None:
+        size = storage.get_upload_path(file_id).stat().st_size
 
     return UploadResponse(
         file_id=file_id,
         filename=file.filename or "unknown",
-        size=len(content),
+        size=size,
         mime_type=file.content_type or "application/octet-stream",
     )
@@ -1,9 +1,9 @@
 """Pydantic request models for the API."""
 
 from enum import Enum
-from typing import Annotated, Literal, Union
+from typing import Annotated, Literal, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class OutputFormat(str, Enum):
@@ -111,6 +111,9 @@ class GenerateRequest(BaseModel):
     preferences: Preferences = Field(default_factory=Preferences)
     cache: CacheOptions = Field(default_factory=CacheOptions)
 
+    # Memoized by CacheService.generate_cache_key (get/set share one hash)
+    _cache_key: Optional[str] = PrivateAttr(default=None)
+
     model_config = ConfigDict(
         json_schema_extra={
             "examples": [
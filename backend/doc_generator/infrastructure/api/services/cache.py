@@ -1,21 +1,95 @@
 """Cache service for generated documents."""
 
+import asyncio
+import base64
+import functools
 import hashlib
 import json
+import os
 import shutil
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ...settings import get_settings
 from ..schemas.requests import GenerateRequest
 
+# Identifying field of each source type, hashed alongside the type tag
+_SOURCE_KEY_FIELDS = {"text": "content", "url": "url", "file": "file_id"}
+
+# Entries kept in memory in front of the on-disk JSON files
+_MEMORY_CACHE_SIZE = 256
+
+
+class _CacheStats:
+    """Entry-size counters shared by every CacheService on one cache dir."""
+
+    def __init__(self):
+        """
+        Start empty; the first CacheService on the dir seeds the counters.
+        Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+        """
+        self.lock = threading.Lock()
+        self.entry_sizes: dict[str, int] = {}
+        self.total_size = 0
+        # While the seed scan runs, evicted keys and clears are recorded so
+        # the merge does not count entries removed mid-scan
+        self.seeding = True
+        self.removed: set[str] = set()
+        self.generation = 0
+
+
+# Stats per resolved cache dir, shared across CacheService instances
+_cache_stats: dict[str, _CacheStats] = {}
+_cache_stats_lock = threading.Lock()
+
+
+def _dumps(data: dict) -> bytes:
+    """
+    Serialize to compact JSON bytes, using orjson when installed.
+
+    Both paths emit identical bytes for the plain dicts stored here.
+    Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _loads(raw: bytes) -> dict:
+    """
+    Parse JSON bytes, using orjson when installed.
+    Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _encode_digest(digest: bytes) -> str:
+    """
+    Encode a digest as unpadded URL-safe base64 (43 chars for SHA-256).
+    Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+    """
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
 
 class CacheService:
     """Content-based cache for generated documents."""
 
+    # Key hash constructor; swap for another hashlib-style factory if needed
+    _hasher_factory = staticmethod(hashlib.sha256)
+
     def __init__(
         self,
         cache_dir: Path | None = None,
@@ -33,59 +107,85 @@ class CacheService:
         self.cache_dir = Path(cache_dir)
         self.ttl_seconds = ttl_seconds
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._mem: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        # Stats counters: seeded by a background scan, then kept current by
+        # set/invalidate/clear_all so get_stats never touches the disk
+        stats_key = str(self.cache_dir.resolve())
+        with _cache_stats_lock:
+            self._stats = _cache_stats.get(stats_key)
+            first_use = self._stats is None
+            if first_use:
+                self._stats = _cache_stats[stats_key] = _CacheStats()
+        if first_use:
+            threading.Thread(target=self._seed_stats, name="cache-stats", daemon=True).start()
 
     def generate_cache_key(self, request: GenerateRequest) -> str:
         """Generate cache key from request.
 
-        The key is a SHA256 hash of the normalized request content.
+        The key is a SHA256 hash of the normalized request content, encoded
+        as URL-safe base64 so it can be used directly as a file name. It is
+        computed once per request and memoized on the request object.
 
         Args:
             request: Generate request
 
         Returns:
-            64-character hex string cache key
+            43-character URL-safe cache key
         Invoked by: src/doc_generator/infrastructure/api/services/cache.py, tests/api/test_cache_service.py
         """
-        # Build canonical representation
-        canonical = {
-            "output_format": request.output_format.value,
-            "sources": self._normalize_sources(request.sources),
-            "provider": request.provider.value,
-            "model": request.model,
-            "image_model": request.image_model,
-            "preferences": {
-                "audience": request.preferences.audience.value,
-                "image_style": request.preferences.image_style.value,
-                "temperature": request.preferences.temperature,
-                "max_tokens": request.preferences.max_tokens,
-                "max_slides": request.preferences.max_slides,
-                "max_summary_points": request.preferences.max_summary_points,
-            },
-        }
+        if request._cache_key is not None:
+            return request._cache_key
+
+        h = self._hasher_factory()
+        self._feed_canonical(h, request)
+        request._cache_key = _encode_digest(h.digest())
+        return request._cache_key
 
-        # Generate hash
-        canonical_json = json.dumps(canonical, sort_keys=True)
-        return hashlib.sha256(canonical_json.encode()).hexdigest()
+    def _feed_canonical(self, h, request: GenerateRequest) -> None:
+        """
+        Stream the normalized request fields into a hasher.
 
-    def _normalize_sources(self, sources: list) -> list:
+        Fields are written in a fixed order, each prefixed with its byte
+        length so adjacent values cannot run together.
+        Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+        """
+        def feed(value) -> None:
+            raw = str(value).encode()
+            h.update(len(raw).to_bytes(8, "little"))
+            h.update(raw)
+
+        prefs = request.preferences
+        feed(request.output_format.value)
+        feed(len(request.sources))
+        for source in self._normalize_sources(request.sources):
+            for value in source:
+                feed(value)
+        feed(request.provider.value)
+        feed(request.model)
+        feed(request.image_model)
+        feed(prefs.audience.value)
+        feed(prefs.image_style.value)
+        feed(prefs.temperature)
+        feed(prefs.max_tokens)
+        feed(prefs.max_slides)
+        feed(prefs.max_summary_points)
+
+    def _normalize_sources(self, sources: list) -> list[tuple]:
         """
         Normalize sources for hashing.
         Invoked by: src/doc_generator/infrastructure/api/services/cache.py
         """
         return [self._normalize_source(s) for s in sources]
 
-    def _normalize_source(self, source) -> dict:
+    def _normalize_source(self, source) -> tuple:
         """
-        Normalize a single source for hashing.
+        Normalize a single source to a (type, identifying value) tuple.
         Invoked by: src/doc_generator/infrastructure/api/services/cache.py
         """
-        if source.type == "text":
-            return {"type": "text", "content": source.content}
-        elif source.type == "url":
-            return {"type": "url", "url": source.url}
-        elif source.type == "file":
-            return {"type": "file", "file_id": source.file_id}
-        return {}
+        field = _SOURCE_KEY_FIELDS.get(source.type)
+        if field is None:
+            return ()
+        return (source.type, getattr(source, field))
 
     def get(self, request: GenerateRequest) -> Optional[dict]:
         """Get cached result for request.
@@ -98,23 +198,29 @@ class CacheService:
         Invoked by: .claude/skills/pdf/scripts/check_bounding_boxes.py, .claude/skills/pdf/scripts/extract_form_field_info.py, .claude/skills/pdf/scripts/fill_fillable_fields.py, .claude/skills/pdf/scripts/fill_pdf_form_with_annotations.py, .claude/skills/pptx/ooxml/scripts/validation/base.py, .claude/skills/pptx/ooxml/scripts/validation/pptx.py, .claude/skills/pptx/ooxml/scripts/validation/redlining.py, .claude/skills/pptx/scripts/inventory.py, .claude/skills/pptx/scripts/rearrange.py, .claude/skills/pptx/scripts/replace.py, .claude/skills/pptx/scripts/thumbnail.py, .claude/skills/skill-creator/scripts/quick_validate.py, scripts/generate_from_folder.py, scripts/generate_pdf_from_cache.py, scripts/quick_pdf_with_images.py, scripts/run_generator.py, src/doc_generator/application/graph_workflow.py, src/doc_generator/application/nodes/generate_images.py, src/doc_generator/application/nodes/generate_output.py, src/doc_generator/application/nodes/parse_content.py, src/doc_generator/application/nodes/transform_content.py, src/doc_generator/application/nodes/validate_output.py, src/doc_generator/application/parsers/markdown_parser.py, src/doc_generator/application/parsers/unified_parser.py, src/doc_generator/application/workflow/graph.py, src/doc_generator/application/workflow/nodes/generate_images.py, src/doc_generator/application/workflow/nodes/generate_output.py, src/doc_generator/application/workflow/nodes/parse_content.py, src/doc_generator/application/workflow/nodes/transform_content.py, src/doc_generator/application/workflow/nodes/validate_output.py, src/doc_generator/infrastructure/api/routes/cache.py, src/doc_generator/infrastructure/api/routes/download.py, src/doc_generator/infrastructure/api/routes/generate.py, src/doc_generator/infrastructure/api/routes/health.py, src/doc_generator/infrastructure/api/services/generation.py, src/doc_generator/infrastructure/image/claude_svg.py, src/doc_generator/infrastructure/image/svg.py, src/doc_generator/infrastructure/image/validator.py, src/doc_generator/infrastructure/llm/content_generator.py, src/doc_generator/infrastructure/llm/service.py, src/doc_generator/infrastructure/storage/file_storage.py, src/doc_generator/utils/content_merger.py, tests/api/test_cache_service.py, tests/api/test_generate_route.py, tests/api/test_health_route.py
         """
         key = self.generate_cache_key(request)
-        cache_file = self.cache_dir / f"{key}.json"
-
-        if not cache_file.exists():
-            return None
+        cached = self._mem.get(key)
+        if cached is not None:
+            created_at, data = cached
+            if time.time() - created_at > self.ttl_seconds:
+                self._evict(key)
+                return None
+            self._mem.move_to_end(key)
+            return data
 
+        cache_file = self.cache_dir / f"{key}.json"
         try:
-            data = json.loads(cache_file.read_text())
-
-            # Check if expired
-            if time.time() - data["created_at"] > self.ttl_seconds:
-                cache_file.unlink()
+            # Entries are written once, so mtime tracks created_at; checking it
+            # first skips reading and parsing expired files
+            if time.time() - cache_file.stat().st_mtime > self.ttl_seconds:
+                self._evict(key)
                 return None
-
-            return data
-        except (json.JSONDecodeError, KeyError):
+            data = _loads(cache_file.read_bytes())
+            self._remember(key, data)
+        except (OSError, ValueError, KeyError):
             return None
 
+        return data
+
     def set(
         self,
         request: GenerateRequest,
@@ -134,7 +240,6 @@ class CacheService:
         Invoked by: .claude/skills/pdf/scripts/extract_form_field_info.py, .claude/skills/pptx/ooxml/scripts/validation/base.py, .claude/skills/pptx/ooxml/scripts/validation/pptx.py, .claude/skills/pptx/scripts/rearrange.py, .claude/skills/pptx/scripts/replace.py, .claude/skills/skill-creator/scripts/quick_validate.py, src/doc_generator/application/graph_workflow.py, src/doc_generator/application/workflow/graph.py, src/doc_generator/infrastructure/api/routes/generate.py, src/doc_generator/infrastructure/image/gemini.py, src/doc_generator/infrastructure/image/svg.py, src/doc_generator/infrastructure/llm/content_generator.py, src/doc_generator/infrastructure/llm/service.py, src/doc_generator/utils/content_merger.py, tests/api/test_cache_service.py
         """
         key = self.generate_cache_key(request)
-        cache_file = self.cache_dir / f"{key}.json"
 
         if file_path is None:
             file_path = str(output_path)
@@ -147,9 +252,40 @@ class CacheService:
             "created_at": time.time(),
         }
 
-        cache_file.write_text(json.dumps(data))
+        self._remember(key, data)
+        # Serialized here so the writer never shares the dict handed to callers
+        payload = _dumps(data)
+
+        # Write-back: the in-memory entry serves reads while the file is written
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._persist(key, payload)
+        else:
+            future = loop.run_in_executor(None, self._persist, key, payload)
+            future.add_done_callback(functools.partial(self._log_persist_failure, key))
         return key
 
+    def _persist(self, key: str, payload: bytes) -> None:
+        """
+        Write the entry to disk and update the stats counters.
+        Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+        """
+        (self.cache_dir / f"{key}.json").write_bytes(payload)
+        stats = self._stats
+        with stats.lock:
+            stats.total_size += len(payload) - stats.entry_sizes.get(key, 0)
+            stats.entry_sizes[key] = len(payload)
+
+    @staticmethod
+    def _log_persist_failure(key: str, future: asyncio.Future) -> None:
+        """
+        Report a failed write-back, which would otherwise be dropped silently.
+        Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+        """
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning("Failed to persist cache entry {}: {}", key, future.exception())
+
     def invalidate(self, request: GenerateRequest) -> bool:
         """Invalidate cache entry.
 
@@ -161,12 +297,76 @@ class CacheService:
         Invoked by: (no references found)
         """
         key = self.generate_cache_key(request)
-        cache_file = self.cache_dir / f"{key}.json"
+        return self._evict(key)
 
-        if cache_file.exists():
-            cache_file.unlink()
-            return True
-        return False
+    def _remember(self, key: str, data: dict) -> None:
+        """
+        Insert an entry into the in-memory LRU, dropping the oldest beyond the cap.
+        Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+        """
+        self._mem[key] = (data["created_at"], data)
+        self._mem.move_to_end(key)
+        while len(self._mem) > _MEMORY_CACHE_SIZE:
+            self._mem.popitem(last=False)
+
+    def _seed_stats(self) -> None:
+        """
+        Scan existing entries once to seed the shared stats counters.
+
+        The scan runs without the lock so event-loop callers never wait on
+        it; the merge skips keys written, evicted or cleared meanwhile.
+        Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+        """
+        stats = self._stats
+        with stats.lock:
+            generation = stats.generation
+        found = {}
+        for entry in self._scan_entries():
+            try:
+                found[entry.name[:-5]] = entry.stat().st_size
+            except OSError:
+                continue
+        with stats.lock:
+            # A clear during the scan deleted everything it found
+            if stats.generation == generation:
+                for key, size in found.items():
+                    if key in stats.entry_sizes or key in stats.removed:
+                        continue
+                    stats.entry_sizes[key] = size
+                    stats.total_size += size
+            stats.seeding = False
+            stats.removed.clear()
+
+    def _scan_entries(self) -> list[os.DirEntry]:
+        """
+        List cache entry files with one scandir pass (no Path objects).
+        Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+        """
+        try:
+            with os.scandir(self.cache_dir) as it:
+                return [e for e in it if e.name.endswith(".json") and e.is_file()]
+        except FileNotFoundError:
+            return []
+
+    def _evict(self, key: str) -> bool:
+        """
+        Drop an entry from memory and disk.
+
+        Returns:
+            True if an entry existed on disk
+        Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+        """
+        self._mem.pop(key, None)
+        stats = self._stats
+        with stats.lock:
+            stats.total_size -= stats.entry_sizes.pop(key, 0)
+            if stats.seeding:
+                stats.removed.add(key)
+        try:
+            (self.cache_dir / f"{key}.json").unlink()
+        except FileNotFoundError:
+            return False
+        return True
 
     def clear_all(self) -> dict:
         """Clear all cache entries.
@@ -175,18 +375,34 @@ class CacheService:
             Dict with count of cleared items
         Invoked by: (no references found)
         """
-        cache_files = list(self.cache_dir.glob("*.json"))
-        count = len(cache_files)
-
-        for f in cache_files:
+        count = 0
+        for entry in self._scan_entries():
             try:
-                f.unlink()
+                os.unlink(entry.path)
+                count += 1
             except OSError:
                 pass
 
+        self.clear()
+
         logger.info(f"Cleared {count} cache entries")
         return {"cleared_cache_entries": count}
 
+    def clear(self) -> None:
+        """
+        Forget in-memory entries and reset the stats counters.
+
+        Must follow any deletion of entry files so memory hits do not point
+        at removed entries or outputs.
+        Invoked by: src/doc_generator/infrastructure/api/services/cache.py
+        """
+        self._mem.clear()
+        stats = self._stats
+        with stats.lock:
+            stats.entry_sizes.clear()
+            stats.total_size = 0
+            stats.generation += 1
+
     def get_stats(self) -> dict:
         """Get cache statistics.
 
@@ -194,11 +410,8 @@ class CacheService:
             Dict with cache stats
         Invoked by: (no references found)
         """
-        cache_files = list(self.cache_dir.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in cache_files if f.exists())
-
         return {
-            "cache_entries": len(cache_files),
-            "cache_size_bytes": total_size,
+            "cache_entries": len(self._stats.entry_sizes),
+            "cache_size_bytes": self._stats.total_size,
             "cache_dir": str(self.cache_dir),
         }
@@ -2,8 +2,10 @@
 
 import json
 import os
+import threading
 import uuid
 from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import AsyncIterator
 
 from loguru import logger
@@ -33,6 +35,41 @@ from ..schemas.idea_canvas import (
 )
 
 
+# Environment variables each provider's client reads its API key from
+_API_KEY_ENV_VARS = MappingProxyType({
+    "gemini": ("GEMINI_API_KEY", "GOOGLE_API_KEY"),
+    "google": ("GEMINI_API_KEY", "GOOGLE_API_KEY"),
+    "openai": ("OPENAI_API_KEY",),
+    "anthropic": ("ANTHROPIC_API_KEY",),
+})
+
+# Shared by all IdeaCanvasService instances; created on first use
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared thread pool for blocking LLM calls."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    thread_name_prefix="docgen",
+                )
+    return _EXECUTOR
+
+
+def close_executor() -> None:
+    """Shut down the shared thread pool (called on application shutdown)."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+            _EXECUTOR = None
+
+
 class CanvasSession:
     """Represents an active canvas session."""
 
@@ -147,18 +184,15 @@ class IdeaCanvasService:
     """Service for managing idea canvas sessions."""
 
     def __init__(self):
-        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._executor = _get_executor()
         self._sessions: dict[str, CanvasSession] = {}
 
     def _configure_api_key(self, provider: str, api_key: str) -> None:
         """Configure API key in environment for the provider."""
-        if provider in ("gemini", "google"):
-            os.environ["GEMINI_API_KEY"] = api_key
-            os.environ["GOOGLE_API_KEY"] = api_key
-        elif provider == "openai":
-            os.environ["OPENAI_API_KEY"] = api_key
-        elif provider == "anthropic":
-            os.environ["ANTHROPIC_API_KEY"] = api_key
+        for env_var in _API_KEY_ENV_VARS.get(provider, ()):
+            # Skip the write (and putenv) when the same key is reused
+            if os.environ.get(env_var) != api_key:
+                os.environ[env_var] = api_key
 
     def _call_llm_with_fallback(
         self,
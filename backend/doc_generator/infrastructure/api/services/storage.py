@@ -1,13 +1,61 @@
 """Storage service for uploads and outputs."""
 
+import base64
+import hashlib
+import os
+import queue
 import secrets
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
+from typing import BinaryIO
 
 from loguru import logger
 
 from ...settings import get_settings
 
+# Chunk size for streamed upload writes; each pooled buffer is this large
+_UPLOAD_CHUNK_SIZE = 8 << 20
+
+# CSPRNG bytes fetched per os.urandom call and sliced into ids/tokens
+_RANDOM_POOL_SIZE = 4096
+_random_pool = b""
+_random_offset = 0
+_random_lock = threading.Lock()
+
+
+def _random_bytes(n: int) -> bytes:
+    """Return n bytes from the OS CSPRNG, refilling a shared pool as needed.
+
+    Ids and download tokens stay unpredictable (every byte comes from
+    secrets), but one syscall now serves hundreds of them.
+    """
+    global _random_pool, _random_offset
+    with _random_lock:
+        if _random_offset + n > len(_random_pool):
+            _random_pool = secrets.token_bytes(max(_RANDOM_POOL_SIZE, n))
+            _random_offset = 0
+        chunk = _random_pool[_random_offset:_random_offset + n]
+        _random_offset += n
+    return chunk
+
+
+def _reset_random_pool() -> None:
+    """Drop pooled bytes in a forked child so workers never share ids."""
+    global _random_pool, _random_offset, _random_lock
+    _random_pool = b""
+    _random_offset = 0
+    _random_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_random_pool)
+
+# Upload blob dirs already pruned in this process (instances are created per run)
+_pruned_blob_dirs: set[str] = set()
+_pruned_blob_dirs_lock = threading.Lock()
+
+
 class StorageService:
     """Manages uploads and generated outputs with organized folder structure.
     
@@ -21,17 +69,32 @@ class StorageService:
             cache/           - Cache metadata files
     """
 
+    __slots__ = (
+        "base_output_dir",
+        "cache_dir",
+        "base_url",
+        "_url_prefix",
+        "max_uploads",
+        "_uploads",
+        "upload_blob_dir",
+    )
+
+    # Reusable chunk buffers for streamed uploads, shared by all instances
+    _buf_pool: "queue.LifoQueue[bytearray]" = queue.LifoQueue(maxsize=4)
+
     def __init__(
         self,
         base_output_dir: Path | None = None,
         cache_dir: Path | None = None,
         base_url: str = "/api/download",
+        max_uploads: int = 10000,
     ):
         """Initialize storage service.
 
         Args:
             base_output_dir: Base directory for all outputs
             base_url: Base URL for download links
+            max_uploads: Upload metadata entries kept in memory (LRU)
         Invoked by: (no references found)
         """
         settings = get_settings()
@@ -43,13 +106,25 @@ class StorageService:
         self.base_output_dir = Path(base_output_dir)
         self.cache_dir = Path(cache_dir)
         self.base_url = base_url
+        self._url_prefix = f"{base_url}/"
+        self.max_uploads = max_uploads
 
         # Ensure base directories exist
         self.base_output_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Track upload metadata
-        self._uploads: dict[str, dict] = {}
+        # Track upload metadata (LRU order, bounded by max_uploads)
+        self._uploads: OrderedDict[str, dict] = OrderedDict()
+
+        # Content-addressed copies of uploads; identical uploads share an inode
+        self.upload_blob_dir = self.base_output_dir / "upload_blobs"
+        self.upload_blob_dir.mkdir(parents=True, exist_ok=True)
+        blob_key = str(self.upload_blob_dir.resolve())
+        with _pruned_blob_dirs_lock:
+            first_use = blob_key not in _pruned_blob_dirs
+            _pruned_blob_dirs.add(blob_key)
+        if first_use:
+            threading.Thread(target=self._prune_upload_blobs, daemon=True).start()
 
     def _get_file_dir(self, file_id: str) -> Path:
         """Get the directory for a specific file_id.
@@ -83,7 +158,7 @@ class StorageService:
 
     def save_upload(
         self,
-        content: bytes,
+        content: bytes | BinaryIO,
         filename: str,
         mime_type: str,
     ) -> str:
@@ -93,7 +168,7 @@ class StorageService:
         data/output/<file_id>/source/<original_filename>
 
         Args:
-            content: File content bytes
+            content: File content bytes, or a binary stream copied in chunks
             filename: Original filename
             mime_type: MIME type of file
 
@@ -103,13 +178,19 @@ class StorageService:
         Used by: src/doc_generator/infrastructure/api/routes/upload.py
         Invoked by: src/doc_generator/infrastructure/api/routes/upload.py, tests/api/test_storage_service.py
         """
-        file_id = f"f_{secrets.token_hex(12)}"
+        file_id = f"f_{_random_bytes(12).hex()}"
         dirs = self._ensure_file_dirs(file_id)
         
         # Save to source directory with original filename
         storage_path = dirs["source"] / filename
 
-        storage_path.write_bytes(content)
+        hasher = hashlib.sha256()
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            hasher.update(content)
+            storage_path.write_bytes(content)
+        else:
+            self._write_stream(storage_path, content, hasher)
+        blob_path = self._dedup_upload(storage_path, hasher.hexdigest())
         logger.info(f"Saved upload: {storage_path}")
 
         self._uploads[file_id] = {
@@ -118,11 +199,103 @@ class StorageService:
             "path": storage_path,
             "file_id": file_id,
             "dirs": dirs,
+            "blob": blob_path,
             "created_at": time.time(),
         }
+        # Only metadata is evicted; get_upload_path falls back to the disk
+        while len(self._uploads) > self.max_uploads:
+            self._uploads.popitem(last=False)
 
         return file_id
 
+    def _write_stream(self, path: Path, stream: BinaryIO, hasher=None) -> int:
+        """Copy a binary stream to disk through a pooled chunk buffer.
+
+        Peak memory stays at one chunk regardless of upload size, and the
+        chunk buffer is reused across uploads instead of reallocated. Each
+        chunk is also fed to hasher, if given, so no second read is needed.
+
+        Returns:
+            Number of bytes written
+
+        Used by: save_upload.
+        Invoked by: src/doc_generator/infrastructure/api/services/storage.py
+        """
+        try:
+            buf = self._buf_pool.get_nowait()
+        except queue.Empty:
+            buf = bytearray(_UPLOAD_CHUNK_SIZE)
+
+        total = 0
+        try:
+            with memoryview(buf) as view, open(path, "wb") as out:
+                while n := stream.readinto(view):
+                    out.write(view[:n])
+                    if hasher is not None:
+                        hasher.update(view[:n])
+                    total += n
+        finally:
+            try:
+                self._buf_pool.put_nowait(buf)
+            except queue.Full:
+                pass
+        return total
+
+    def _dedup_upload(self, storage_path: Path, content_hash: str) -> Path | None:
+        """Share identical uploads through one hardlinked blob.
+
+        The first upload with a given hash is linked into upload_blob_dir;
+        later identical uploads are replaced by a link to that blob, so
+        repeated templates or logos occupy disk once.
+
+        Returns:
+            Blob path, or None if linking is not possible here
+
+        Used by: save_upload.
+        Invoked by: src/doc_generator/infrastructure/api/services/storage.py
+        """
+        blob_path = self.upload_blob_dir / content_hash[:2] / content_hash[2:]
+        try:
+            blob_path.parent.mkdir(exist_ok=True)
+            os.link(storage_path, blob_path)
+        except FileExistsError:
+            try:
+                tmp_path = storage_path.with_name(f".{storage_path.name}.dedup")
+                os.link(blob_path, tmp_path)
+                os.replace(tmp_path, storage_path)
+            except OSError as e:
+                logger.debug("Upload dedup skipped for {}: {}", storage_path, e)
+                return None
+        except OSError as e:
+            # e.g. a filesystem without hardlink support
+            logger.debug("Upload dedup skipped for {}: {}", storage_path, e)
+            return None
+        return blob_path
+
+    def _prune_upload_blobs(self) -> None:
+        """Remove blobs no longer linked from any upload directory.
+
+        Upload directories are deleted wholesale (cache clear, manual
+        cleanup), which leaves their blobs with a single link.
+
+        Invoked by: src/doc_generator/infrastructure/api/services/storage.py
+        """
+        removed = 0
+        try:
+            with os.scandir(self.upload_blob_dir) as shards:
+                for shard in shards:
+                    if not shard.is_dir(follow_symlinks=False):
+                        continue
+                    with os.scandir(shard.path) as blobs:
+                        for blob in blobs:
+                            if blob.stat(follow_symlinks=False).st_nlink == 1:
+                                os.unlink(blob.path)
+                                removed += 1
+        except OSError as e:
+            logger.debug("Upload blob prune stopped: {}", e)
+        if removed:
+            logger.info("Pruned {} orphaned upload blobs", removed)
+
     def get_upload_path(self, file_id: str) -> Path:
         """Get path to uploaded file.
 
@@ -139,6 +312,7 @@ class StorageService:
         Invoked by: src/doc_generator/infrastructure/api/services/generation.py, src/doc_generator/infrastructure/storage/file_storage.py, tests/api/test_storage_service.py
         """
         if file_id in self._uploads:
+            self._uploads.move_to_end(file_id)
             return self._uploads[file_id]["path"]
         
         # Try to find on disk if not in memory (after server restart)
@@ -166,7 +340,7 @@ class StorageService:
         Invoked by: src/doc_generator/infrastructure/api/routes/generate.py, src/doc_generator/infrastructure/api/services/generation.py, tests/api/test_storage_service.py
         """
         # Generate a simple token (in production, use signed URLs)
-        token = secrets.token_urlsafe(16)
+        token = base64.urlsafe_b64encode(_random_bytes(16)).rstrip(b"=").decode("ascii")
         
         # Try to extract file_id and create a cleaner URL
         parts = output_path.parts
@@ -174,18 +348,18 @@ class StorageService:
             if part.startswith("f_"):
                 # Found file_id, construct relative path from there
                 rel_path = "/".join(parts[i:])
-                return f"{self.base_url}/{rel_path}?token={token}"
+                return f"{self._url_prefix}{rel_path}?token={token}"
 
         # Use path relative to output root when possible to avoid collisions
         try:
             rel_path = output_path.relative_to(self.base_output_dir).as_posix()
-            return f"{self.base_url}/{rel_path}?token={token}"
+            return f"{self._url_prefix}{rel_path}?token={token}"
         except ValueError:
             pass
 
         # Fallback to just filename
         filename = output_path.name
-        return f"{self.base_url}/{filename}?token={token}"
+        return f"{self._url_prefix}{filename}?token={token}"
 
     # Legacy compatibility properties
     @property
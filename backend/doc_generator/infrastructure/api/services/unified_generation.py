@@ -8,8 +8,10 @@ while enabling session-based state reuse across output formats.
 import base64
 import json
 import os
+import time
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncIterator, Callable, Optional
 
@@ -52,9 +54,13 @@ from .storage import StorageService
 
 DEFAULT_INLINE_PREVIEW_BYTES = 8 * 1024 * 1024
 
+# Minimum spacing between streamed workflow progress events (seconds)
+_MIN_PROGRESS_INTERVAL = 0.1
 
+
+@lru_cache(maxsize=1)
 def _get_max_inline_preview_bytes() -> int:
-    """Return max bytes to include inline previews in responses."""
+    """Return max bytes to include inline previews in responses (read once per process)."""
     raw_value = os.getenv("DOCGEN_MAX_INLINE_PREVIEW_BYTES")
     if raw_value is None:
         return DEFAULT_INLINE_PREVIEW_BYTES
@@ -224,19 +230,39 @@ class UnifiedGenerationService:
             )
 
             # 5. Monitor Workflow & Stream Progress
+            # Fast steps are coalesced: an event arriving within
+            # _MIN_PROGRESS_INTERVAL of the previous one is held back unless it
+            # starts a new phase, and is flushed once the queue goes quiet.
+            last_emit = 0.0
+            last_status = None
+            pending: ProgressEvent | None = None
             while True:
                 # If the workflow is done and no more progress events are in queue, stop.
                 if workflow_future.done() and progress_queue.empty():
+                    if pending is not None:
+                        yield pending
                     break
                 try:
                     # Wait for a progress event from the queue with a short timeout.
                     # This allows us to frequently check if the workflow has finished.
                     event = await asyncio.wait_for(progress_queue.get(), timeout=0.2)
-                    yield event
                 except asyncio.TimeoutError:
                     # No new progress event in 0.2s, loop back to check status.
+                    if pending is not None:
+                        yield pending
+                        last_emit = time.monotonic()
+                        pending = None
                     continue
 
+                now = time.monotonic()
+                if event.status != last_status or now - last_emit >= _MIN_PROGRESS_INTERVAL:
+                    yield event
+                    last_emit = now
+                    last_status = event.status
+                    pending = None
+                else:
+                    pending = event
+
             # 6. Get Final Result
             # Await the future to get the return value (or raise exception if it failed).
             result, session_id = await workflow_future
@@ -672,18 +698,15 @@ class UnifiedGenerationService:
         """Run the unified workflow asynchronously."""
         import asyncio
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: run_unified_workflow_with_session(
-                output_type=output_type,
-                request_data=request_data,
-                api_key=api_key,
-                gemini_api_key=gemini_api_key,
-                user_id=user_id,
-                session_id=session_id,
-                progress_callback=progress_callback,
-            ),
+        return await asyncio.to_thread(
+            run_unified_workflow_with_session,
+            output_type=output_type,
+            request_data=request_data,
+            api_key=api_key,
+            gemini_api_key=gemini_api_key,
+            user_id=user_id,
+            session_id=session_id,
+            progress_callback=progress_callback,
         )
 
     def _parse_mindmap_node(self, node_data: dict, prefix: str = "node") -> MindMapNode:
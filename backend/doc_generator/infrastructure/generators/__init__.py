@@ -8,6 +8,17 @@ from .pdf import PDFGenerator
 from .pdf_from_pptx import PDFFromPPTXGenerator
 from .pptx import PPTXGenerator
 
+# Lowercased format name (including aliases) -> generator class
+_GENERATORS = {
+    OutputFormat.PDF.value: PDFGenerator,
+    OutputFormat.PPTX.value: PPTXGenerator,
+    "ppt": PPTXGenerator,
+    OutputFormat.MARKDOWN.value: MarkdownGenerator,
+    "md": MarkdownGenerator,
+    OutputFormat.PDF_FROM_PPTX.value: PDFFromPPTXGenerator,
+    OutputFormat.FAQ.value: FAQGenerator,
+}
+
 
 def get_generator(output_format: str):
     """
@@ -22,24 +33,10 @@ def get_generator(output_format: str):
     Raises:
         UnsupportedFormatError: If format is not supported
     """
-    format_lower = output_format.lower()
-
-    if format_lower in ["pdf", OutputFormat.PDF]:
-        return PDFGenerator()
-
-    if format_lower in ["pptx", "ppt", OutputFormat.PPTX]:
-        return PPTXGenerator()
-
-    if format_lower in ["markdown", "md", OutputFormat.MARKDOWN]:
-        return MarkdownGenerator()
-
-    if format_lower in ["pdf_from_pptx", OutputFormat.PDF_FROM_PPTX]:
-        return PDFFromPPTXGenerator()
-
-    if format_lower in ["faq", OutputFormat.FAQ]:
-        return FAQGenerator()
-
-    raise UnsupportedFormatError(f"Unsupported output format: {output_format}")
+    generator_cls = _GENERATORS.get(output_format.lower())
+    if generator_cls is None:
+        raise UnsupportedFormatError(f"Unsupported output format: {output_format}")
+    return generator_cls()
 
 
 __all__ = [
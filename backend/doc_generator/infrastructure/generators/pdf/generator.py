@@ -23,6 +23,7 @@ from reportlab.platypus import (
 
 from ....domain.exceptions import GenerationError
 from .utils import (
+    CONTENT_WIDTH,
     create_custom_styles,
     extract_headings,
     inline_md,
@@ -214,7 +215,7 @@ class PDFGenerator:
         # Accent bar at top (visual branding element)
         from reportlab.lib import colors as rl_colors
 
-        accent_bar = Table([[""]], colWidths=[6.9 * inch], rowHeights=[8])
+        accent_bar = Table([[""]], colWidths=[CONTENT_WIDTH], rowHeights=[8])
         accent_bar.setStyle(
             TableStyle(
                 [
@@ -292,6 +293,8 @@ class PDFGenerator:
             )
             story.append(PageBreak())
 
+        bullet_style = self.styles["BulletCustom"]
+
         if exec_summary:
             story.append(Spacer(1, 12))
             story.append(make_banner("Executive Summary", self.styles))
@@ -299,14 +302,10 @@ class PDFGenerator:
             # Parse summary as markdown (may have bullets)
             for kind, content_item in parse_markdown_lines(exec_summary):
                 if kind == "bullets":
-                    for item in content_item:
-                        story.append(
-                            Paragraph(
-                                inline_md(item),
-                                self.styles["BulletCustom"],
-                                bulletText="•",
-                            )
-                        )
+                    story.extend(
+                        Paragraph(inline_md(item), bullet_style, bulletText="•")
+                        for item in content_item
+                    )
                 elif kind == "para" and content_item.strip():
                     story.append(
                         Paragraph(inline_md(content_item), self.styles["BodyCustom"])
@@ -464,12 +463,10 @@ class PDFGenerator:
                 story.append(Spacer(1, 12))
 
             elif kind == "bullets":
-                for item in content_item:
-                    story.append(
-                        Paragraph(
-                            inline_md(item), self.styles["BulletCustom"], bulletText="•"
-                        )
-                    )
+                story.extend(
+                    Paragraph(inline_md(item), bullet_style, bulletText="•")
+                    for item in content_item
+                )
                 story.append(Spacer(1, 8))
 
             elif kind == "mermaid":
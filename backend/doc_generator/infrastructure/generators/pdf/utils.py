@@ -7,13 +7,14 @@ including markdown parsing, styling, and flowable creation.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import html
 import re
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator
 
 from loguru import logger
 from reportlab.lib import colors
@@ -75,8 +76,143 @@ def _load_palette() -> dict:
 
 PALETTE = _load_palette()
 CONTENT_WIDTH = 6.9 * inch
+IMAGE_MAX_HEIGHT = 4.4 * inch
+
+# Fixed flowable styles, built once; Table.setStyle only reads the commands
+_DIVIDER_STYLE = TableStyle(
+    [
+        ("LINEABOVE", (0, 0), (-1, -1), 2, PALETTE["accent"]),
+        ("TOPPADDING", (0, 0), (-1, -1), 0),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+    ]
+)
+_BANNER_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, -1), PALETTE["accent"]),
+        ("TEXTCOLOR", (0, 0), (-1, -1), colors.white),
+        ("LEFTPADDING", (0, 0), (-1, -1), 10),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 10),
+        ("TOPPADDING", (0, 0), (-1, -1), 6),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+    ]
+)
+_CODE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), PALETTE["panel"]),
+        ("BACKGROUND", (0, 1), (-1, -1), PALETTE["code"]),
+        ("BOX", (0, 0), (-1, -1), 0.8, PALETTE["line"]),
+        ("LINEBELOW", (0, 0), (-1, 0), 0.6, PALETTE["line"]),
+        ("LEFTPADDING", (0, 0), (-1, -1), 8),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+        ("TOPPADDING", (0, 0), (-1, 0), 4),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 3),
+        ("TOPPADDING", (0, 1), (-1, -1), 6),
+        ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
+    ]
+)
+_QUOTE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#F4FBF8")),
+        ("BOX", (0, 0), (-1, -1), 1, PALETTE["line"]),
+        ("LEFTPADDING", (0, 0), (-1, -1), 10),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 10),
+        ("TOPPADDING", (0, 0), (-1, -1), 8),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+    ]
+)
+# make_table appends per-row striping to these
+_TABLE_HEADER_COMMANDS = (
+    ("BACKGROUND", (0, 0), (-1, 0), PALETTE["teal"]),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("GRID", (0, 0), (-1, -1), 0.5, PALETTE["line"]),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("LEFTPADDING", (0, 0), (-1, -1), 8),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+    ("TOPPADDING", (0, 0), (-1, -1), 6),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+)
+
+
+# Markdown patterns compiled once; parse_markdown_lines runs them on every line
+_INLINE_CODE_SPLIT_RE = re.compile(r"(`[^`]+`)")
+_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+_ITALIC_RE = re.compile(r"(?<!\*)\*([^*]+)\*(?!\*)")
+# Text without any of these characters passes through inline_md unchanged
+_INLINE_MARKER_RE = re.compile(r"[`*\[<>&]")
+_SEP_CELL_RE = re.compile(r"^:?-{2,}:?$")
+_VISUAL_RE = re.compile(r"^\[VISUAL:(\w+):([^:]+):([^\]]+)\]$")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+_IMAGE_RE = re.compile(r"^!\[(.*?)\]\((.*?)\)")
+_QUOTE_RE = re.compile(r"^>\s?(.*)$")
+# Same separators str.splitlines() recognises, for lazy line iteration
+_LINE_BREAK_RE = re.compile("\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# Bullet contents matching any of these are treated as code, not list items
+_CODE_BULLET_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"^\w+\s*=\s*\w+.*\(.*\)",  # function calls: var = func(...)
+        r"^(def|class|import|from|if|for|while|return|print|async|await)\s+",  # Python keywords
+        r"^(SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP)\s+",  # SQL keywords
+        r"^[\w_]+\(.*?\)",  # function calls: func(...)
+        r"^(const|let|var|function|async)\s+",  # JavaScript keywords
+        r"^\$\w+",  # shell variables
+        r"^[a-z_]+\s*\(",  # function call at start
+    )
+)
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """
+    Yield the lines of text exactly as str.splitlines() would, without
+    materializing the whole list up front.
+    Invoked by: src/doc_generator/infrastructure/generators/pdf/utils.py, src/doc_generator/infrastructure/pdf_utils.py
+    """
+    start = 0
+    for match in _LINE_BREAK_RE.finditer(text):
+        yield text[start : match.start()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+def _sub_links(text: str, replace: Callable[[str, str], str]) -> str:
+    """
+    Replace markdown links [text](url) via replace(text, url).
 
+    Text and url must be non-empty and end at the first "]" / ")", as with
+    the regex this replaces, but the scan is linear: every "[" before the
+    same "]" shares one outcome, so a failed candidate skips past that "]"
+    instead of rescanning from the next "[".
+    Invoked by: src/doc_generator/infrastructure/generators/pdf/utils.py, src/doc_generator/infrastructure/pdf_utils.py
+    """
+    out: list[str] = []
+    pos = 0
+    start = text.find("[")
+    while start != -1:
+        close = text.find("]", start + 1)
+        if close == -1:
+            break
+        if close > start + 1 and text.startswith("(", close + 1):
+            end = text.find(")", close + 2)
+            if end == -1:
+                break
+            if end > close + 2:
+                out.append(text[pos:start])
+                out.append(replace(text[start + 1 : close], text[close + 2 : end]))
+                pos = end + 1
+                start = text.find("[", pos)
+                continue
+        start = text.find("[", close + 1)
+    if not out:
+        return text
+    out.append(text[pos:])
+    return "".join(out)
 
+
+# Pure function over short strings; table headers and labels repeat a lot
+@functools.lru_cache(maxsize=4096)
 def inline_md(text: str) -> str:
     """
     Convert inline markdown formatting to HTML for ReportLab.
@@ -94,21 +230,22 @@ def inline_md(text: str) -> str:
         Text with HTML formatting for ReportLab
     Invoked by: src/doc_generator/infrastructure/generators/pdf/utils.py, src/doc_generator/infrastructure/pdf_utils.py
     """
+    # Plain prose needs no links, code spans, emphasis or escaping
+    if _INLINE_MARKER_RE.search(text) is None:
+        return text
+
     # First, handle markdown links [text](url) -> clickable links
     # Use a placeholder to avoid conflicts with other formatting
-    link_pattern = r"\[([^\]]+)\]\(([^\)]+)\)"
     links = []
 
-    def replace_link(match):
-        text_part = match.group(1)
-        url = match.group(2)
+    def replace_link(text_part, url):
         links.append((text_part, url))
         return f"__LINK_{len(links)-1}__"
 
-    text = re.sub(link_pattern, replace_link, text)
+    text = _sub_links(text, replace_link)
 
     # Handle code blocks
-    parts = re.split(r"(`[^`]+`)", text)
+    parts = _INLINE_CODE_SPLIT_RE.split(text)
     rendered: list[str] = []
     for part in parts:
         if part.startswith("`") and part.endswith("`") and len(part) >= 2:
@@ -122,8 +259,8 @@ def inline_md(text: str) -> str:
         # For regular text, only escape < and > that could break tags
         # Keep quotes and apostrophes as-is for better readability
         safe = part.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        safe = re.sub(r"\*\*([^*]+)\*\*", r"<b>\1</b>", safe)
-        safe = re.sub(r"(?<!\*)\*([^*]+)\*(?!\*)", r"<i>\1</i>", safe)
+        safe = _BOLD_RE.sub(r"<b>\1</b>", safe)
+        safe = _ITALIC_RE.sub(r"<i>\1</i>", safe)
         rendered.append(safe)
 
     result = "".join(rendered)
@@ -157,7 +294,7 @@ def parse_table(table_lines: list[str]) -> list[list[str]]:
     for line in table_lines:
         parts = [cell.strip() for cell in line.strip().strip("|").split("|")]
         # Skip separator rows (e.g., |---|---|)
-        if all(re.match(r"^:?-{2,}:?$", cell) for cell in parts):
+        if all(_SEP_CELL_RE.match(cell) for cell in parts):
             continue
         rows.append(parts)
     return rows
@@ -187,34 +324,20 @@ def parse_markdown_lines(text: str) -> Iterator[tuple[str, any]]:
         Tuples of (element_type, content)
     Invoked by: (no references found)
     """
-    lines = text.splitlines()
+    lines = _iter_lines(text)
     in_code = False
     code_lang = ""
     code_lines = []
     table_lines = []
     bullets = []
 
-    def flush_table():
-        """
-        Invoked by: src/doc_generator/infrastructure/generators/pdf/utils.py, src/doc_generator/infrastructure/pdf_utils.py
-        """
-        nonlocal table_lines
-        if table_lines:
-            yield ("table", parse_table(table_lines))
-            table_lines = []
-
-    def flush_bullets():
-        """
-        Invoked by: src/doc_generator/infrastructure/generators/pdf/utils.py, src/doc_generator/infrastructure/pdf_utils.py
-        """
-        nonlocal bullets
-        if bullets:
-            yield ("bullets", bullets)
-            bullets = []
-
     for line in lines:
+        # Dispatch on the first character so plain paragraphs skip every regex
+        stripped = line.strip()
+        first = line[:1]
+
         # Code blocks
-        if line.strip().startswith("```"):
+        if stripped.startswith("```"):
             if in_code:
                 content = "\n".join(code_lines)
                 kind = "mermaid" if code_lang == "mermaid" else "code"
@@ -224,7 +347,7 @@ def parse_markdown_lines(text: str) -> Iterator[tuple[str, any]]:
                 in_code = False
             else:
                 in_code = True
-                code_lang = line.strip().lstrip("```").strip().lower()
+                code_lang = stripped.lstrip("```").strip().lower()
             continue
 
         if in_code:
@@ -232,30 +355,21 @@ def parse_markdown_lines(text: str) -> Iterator[tuple[str, any]]:
             continue
 
         # Tables
-        if line.strip().startswith("|") and "|" in line:
+        if stripped.startswith("|"):
             table_lines.append(line)
             continue
 
         if table_lines:
-            yield from flush_table()
+            yield ("table", parse_table(table_lines))
+            table_lines = []
 
         # Bullet lists - but skip if it looks like code
-        list_match = re.match(r"^[-*]\s+(.*)$", line)
-        if list_match:
-            bullet_content = list_match.group(1)
+        # Same as ^[-*]\s+(.*)$ without the regex: marker, then whitespace
+        if first in ("-", "*") and line[1:2].isspace():
+            bullet_content = line[1:].lstrip()
             # Check if the bullet content looks like code (common patterns)
-            code_patterns = [
-                r"^\w+\s*=\s*\w+.*\(.*\)",  # function calls: var = func(...)
-                r"^(def|class|import|from|if|for|while|return|print|async|await)\s+",  # Python keywords
-                r"^(SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP)\s+",  # SQL keywords
-                r"^[\w_]+\(.*?\)",  # function calls: func(...)
-                r"^(const|let|var|function|async)\s+",  # JavaScript keywords
-                r"^\$\w+",  # shell variables
-                r"^[a-z_]+\s*\(",  # function call at start
-            ]
             is_likely_code = any(
-                re.match(pattern, bullet_content, re.IGNORECASE)
-                for pattern in code_patterns
+                pattern.match(bullet_content) for pattern in _CODE_BULLET_RES
             )
 
             if not is_likely_code:
@@ -264,15 +378,16 @@ def parse_markdown_lines(text: str) -> Iterator[tuple[str, any]]:
             # If it looks like code, let it fall through to regular paragraph handling
 
         if bullets:
-            yield from flush_bullets()
+            yield ("bullets", bullets)
+            bullets = []
 
         # Empty lines
-        if not line.strip():
+        if not stripped:
             yield ("spacer", "")
             continue
 
         # Visual markers: [VISUAL:type:title:description]
-        visual_match = re.match(r"^\[VISUAL:(\w+):([^:]+):([^\]]+)\]$", line.strip())
+        visual_match = _VISUAL_RE.match(stripped) if stripped.startswith("[VISUAL:") else None
         if visual_match:
             yield (
                 "visual_marker",
@@ -285,14 +400,14 @@ def parse_markdown_lines(text: str) -> Iterator[tuple[str, any]]:
             continue
 
         # Headings
-        heading_match = re.match(r"^(#{1,6})\s+(.*)$", line)
+        heading_match = _HEADING_RE.match(line) if first == "#" else None
         if heading_match:
             level = len(heading_match.group(1))
             yield (f"h{level}", heading_match.group(2))
             continue
 
         # Images
-        image_match = re.match(r"^!\[(.*?)\]\((.*?)\)", line)
+        image_match = _IMAGE_RE.match(line) if first == "!" else None
         if image_match:
             alt = image_match.group(1) or "Figure"
             url = image_match.group(2)
@@ -300,7 +415,7 @@ def parse_markdown_lines(text: str) -> Iterator[tuple[str, any]]:
             continue
 
         # Quotes
-        quote_match = re.match(r"^>\s?(.*)$", line)
+        quote_match = _QUOTE_RE.match(line) if first == ">" else None
         if quote_match:
             yield ("quote", quote_match.group(1))
             continue
@@ -313,9 +428,9 @@ def parse_markdown_lines(text: str) -> Iterator[tuple[str, any]]:
         kind = "mermaid" if code_lang == "mermaid" else "code"
         yield (kind, "\n".join(code_lines))
     if table_lines:
-        yield from flush_table()
+        yield ("table", parse_table(table_lines))
     if bullets:
-        yield from flush_bullets()
+        yield ("bullets", bullets)
 
 
 def extract_headings(text: str) -> list[tuple[int, str]]:
@@ -490,15 +605,7 @@ def make_section_divider(styles: dict) -> list:
     Invoked by: (no references found)
     """
     divider = Table([[""]], colWidths=[2 * inch])
-    divider.setStyle(
-        TableStyle(
-            [
-                ("LINEABOVE", (0, 0), (-1, -1), 2, PALETTE["accent"]),
-                ("TOPPADDING", (0, 0), (-1, -1), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-            ]
-        )
-    )
+    divider.setStyle(_DIVIDER_STYLE)
     return [Spacer(1, 16), divider, Spacer(1, 16)]
 
 
@@ -515,23 +622,23 @@ def make_banner(text: str, styles: dict) -> Table:
     Invoked by: (no references found)
     """
     banner = Table(
-        [[Paragraph(inline_md(text), styles["SectionBanner"])]], colWidths=[6.9 * inch]
-    )
-    banner.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, -1), PALETTE["accent"]),
-                ("TEXTCOLOR", (0, 0), (-1, -1), colors.white),
-                ("LEFTPADDING", (0, 0), (-1, -1), 10),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 10),
-                ("TOPPADDING", (0, 0), (-1, -1), 6),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-            ]
-        )
+        [[Paragraph(inline_md(text), styles["SectionBanner"])]], colWidths=[CONTENT_WIDTH]
     )
+    banner.setStyle(_BANNER_STYLE)
     return banner
 
 
+@functools.lru_cache(maxsize=512)
+def _image_size(path_str: str, mtime_ns: int) -> tuple[int, int]:
+    """
+    Read an image's pixel size, memoized per path and modification time.
+
+    mtime_ns is part of the key so a regenerated image is measured again.
+    Invoked by: src/doc_generator/infrastructure/generators/pdf/utils.py
+    """
+    return ImageReader(path_str).getSize()
+
+
 # Global figure counter for image numbering
 _figure_counter = 0
 
@@ -549,8 +656,8 @@ def make_image_flowable(
     alt: str,
     image_path: Path,
     styles: dict,
-    max_width: float = 6.9 * inch,
-    max_height: float = 4.4 * inch,
+    max_width: float = CONTENT_WIDTH,
+    max_height: float = IMAGE_MAX_HEIGHT,
     add_figure_number: bool = True,
 ) -> list:
     """
@@ -570,14 +677,17 @@ def make_image_flowable(
     """
     global _figure_counter
 
-    if not image_path.exists():
+    # One stat for the cache key, then a cached (or first) open; either
+    # failing - missing, vanished or unreadable file - gives the placeholder
+    try:
+        mtime_ns = image_path.stat().st_mtime_ns
+        width_px, height_px = _image_size(str(image_path), mtime_ns)
+    except OSError:
         logger.warning(f"Image not found: {image_path}")
         return [
             Paragraph(f"Image placeholder: {inline_md(alt)}", styles["ImageCaption"])
         ]
 
-    img = ImageReader(str(image_path))
-    width_px, height_px = img.getSize()
     scale = min(max_width / width_px, max_height / height_px)
     render_w = width_px * scale
     render_h = height_px * scale
@@ -677,23 +787,8 @@ def make_code_block(
             header_label += " (continued)"
         header = Paragraph(header_label, styles.get("CodeHeader", styles["BodyText"]))
 
-        table = Table([[header], [block]], colWidths=[6.9 * inch])
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), PALETTE["panel"]),
-                    ("BACKGROUND", (0, 1), (-1, -1), PALETTE["code"]),
-                    ("BOX", (0, 0), (-1, -1), 0.8, PALETTE["line"]),
-                    ("LINEBELOW", (0, 0), (-1, 0), 0.6, PALETTE["line"]),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 8),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-                    ("TOPPADDING", (0, 0), (-1, 0), 4),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 3),
-                    ("TOPPADDING", (0, 1), (-1, -1), 6),
-                    ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
-                ]
-            )
-        )
+        table = Table([[header], [block]], colWidths=[CONTENT_WIDTH])
+        table.setStyle(_CODE_STYLE)
         flow.append(table)
         if i + max_lines < len(lines):
             flow.append(Spacer(1, 6))
@@ -724,7 +819,7 @@ def render_mermaid(
         return None
 
     image_cache.mkdir(parents=True, exist_ok=True)
-    digest = hashlib.sha256(mermaid_text.encode("utf-8")).hexdigest()[:12]
+    digest = hashlib.blake2b(mermaid_text.encode("utf-8"), digest_size=6).hexdigest()
     out_path = image_cache / f"mermaid-{digest}.png"
 
     if out_path.exists():
@@ -780,7 +875,7 @@ def render_mermaid_with_gemini(mermaid_text: str, image_cache: Path) -> Path | N
         return None
 
     image_cache.mkdir(parents=True, exist_ok=True)
-    digest = hashlib.sha256(mermaid_text.encode("utf-8")).hexdigest()[:12]
+    digest = hashlib.blake2b(mermaid_text.encode("utf-8"), digest_size=6).hexdigest()
     out_path = image_cache / f"mermaid-gemini-{digest}.png"
 
     if out_path.exists():
@@ -830,7 +925,7 @@ def make_mermaid_flowable(
         # Header for the diagram box
         header = Table(
             [[Paragraph("<b>Diagram</b>", styles["ImageCaption"])]],
-            colWidths=[6.9 * inch],
+            colWidths=[CONTENT_WIDTH],
         )
         header.setStyle(
             TableStyle(
@@ -853,7 +948,7 @@ def make_mermaid_flowable(
         preview_text = "\n".join(preview_lines)
 
         code_block = Preformatted(preview_text, styles["CodeBlock"])
-        code_table = Table([[code_block]], colWidths=[6.9 * inch])
+        code_table = Table([[code_block]], colWidths=[CONTENT_WIDTH])
         code_table.setStyle(
             TableStyle(
                 [
@@ -871,10 +966,9 @@ def make_mermaid_flowable(
 
         return flow
 
-    img = ImageReader(str(rendered))
-    width_px, height_px = img.getSize()
-    max_width = 6.9 * inch
-    max_height = 4.4 * inch
+    width_px, height_px = _image_size(str(rendered), rendered.stat().st_mtime_ns)
+    max_width = CONTENT_WIDTH
+    max_height = IMAGE_MAX_HEIGHT
     scale = min(max_width / width_px, max_height / height_px)
     render_w = width_px * scale
     render_h = height_px * scale
@@ -897,19 +991,8 @@ def make_quote(text: str, styles: dict) -> Table:
         Table flowable with quote styling
     Invoked by: (no references found)
     """
-    box = Table([[Paragraph(inline_md(text), styles["Quote"])]], colWidths=[6.9 * inch])
-    box.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#F4FBF8")),
-                ("BOX", (0, 0), (-1, -1), 1, PALETTE["line"]),
-                ("LEFTPADDING", (0, 0), (-1, -1), 10),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 10),
-                ("TOPPADDING", (0, 0), (-1, -1), 8),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-            ]
-        )
-    )
+    box = Table([[Paragraph(inline_md(text), styles["Quote"])]], colWidths=[CONTENT_WIDTH])
+    box.setStyle(_QUOTE_STYLE)
     return box
 
 
@@ -969,23 +1052,31 @@ def make_table(table_data: list[list[str]], styles: dict) -> Table:
 
     max_cols = max((len(row) for row in table_data), default=1)
 
+    # Identical cells share one Paragraph. All columns get the same width
+    # below, so a shared Paragraph always wraps to the same layout.
+    cell_paragraphs: dict[str, Paragraph] = {}
+    cell_style = styles["TableCell"]
+
+    def make_cell(markup: str) -> Paragraph:
+        """Return the shared Paragraph for a cell's rendered markup."""
+        paragraph = cell_paragraphs.get(markup)
+        if paragraph is None:
+            paragraph = cell_paragraphs[markup] = Paragraph(markup, cell_style)
+        return paragraph
+
     # Process table data with enhancements and normalize column count
     wrapped = []
     for row_idx, row in enumerate(table_data):
         normalized_row = list(row)
         if len(normalized_row) < max_cols:
             normalized_row.extend([""] * (max_cols - len(normalized_row)))
-        wrapped_row = []
-        for cell in normalized_row:
-            # Skip enhancement for header row
-            if row_idx == 0:
-                wrapped_row.append(Paragraph(inline_md(cell), styles["TableCell"]))
-            else:
-                enhanced_cell = enhance_cell(cell)
-                wrapped_row.append(
-                    Paragraph(inline_md(enhanced_cell), styles["TableCell"])
-                )
-        wrapped.append(wrapped_row)
+        # Skip enhancement for header row
+        if row_idx == 0:
+            wrapped.append([make_cell(inline_md(cell)) for cell in normalized_row])
+        else:
+            wrapped.append(
+                [make_cell(inline_md(enhance_cell(cell))) for cell in normalized_row]
+            )
 
     col_width = CONTENT_WIDTH / max_cols if max_cols else CONTENT_WIDTH
     table = Table(
@@ -996,17 +1087,7 @@ def make_table(table_data: list[list[str]], styles: dict) -> Table:
     )
 
     # Build table style with alternating row colors
-    table_style = [
-        ("BACKGROUND", (0, 0), (-1, 0), PALETTE["teal"]),
-        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("GRID", (0, 0), (-1, -1), 0.5, PALETTE["line"]),
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("LEFTPADDING", (0, 0), (-1, -1), 8),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-        ("TOPPADDING", (0, 0), (-1, -1), 6),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-    ]
+    table_style = list(_TABLE_HEADER_COMMANDS)
 
     # Add alternating row colors for better readability
     for row_idx in range(1, len(table_data)):
@@ -7,6 +7,7 @@ Supports LLM-enhanced slide generation for executive presentations.
 
 import hashlib
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from loguru import logger
@@ -26,6 +27,30 @@ from .utils import (
 from ...llm.service import LLMService, get_llm_service
 from ....utils.image_utils import resolve_image_path
 
+# Characters replaced with "_" when deriving a filename from the title
+_SAFE_TITLE_TABLE = str.maketrans({" ": "_", "/": "_", "\\": "_"})
+
+
+@dataclass(slots=True)
+class SlideSpec:
+    """Normalized LLM slide entry (title, bullets, speaker notes)."""
+
+    title: str
+    bullets: list[str] = field(default_factory=list)
+    speaker_notes: str = ""
+
+    @classmethod
+    def from_dict(cls, slide_data: dict) -> "SlideSpec":
+        """
+        Build a slide spec from an LLM slide dictionary.
+        Invoked by: src/doc_generator/infrastructure/generators/pptx/generator.py
+        """
+        return cls(
+            title=slide_data.get("title", ""),
+            bullets=slide_data.get("bullets") or [],
+            speaker_notes=slide_data.get("speaker_notes", ""),
+        )
+
 
 class PPTXGenerator:
     """
@@ -41,6 +66,7 @@ class PPTXGenerator:
         """
         self.settings = get_settings()
         self._image_cache: Path | None = None
+        self._resolved_images: dict[str, Path | None] = {}
         self._max_bullets_per_slide = 5  # Max bullets per content slide
         self._min_bullets_continuation = 3  # Minimum for continuation slides
 
@@ -109,6 +135,7 @@ class PPTXGenerator:
 
             # Set up image cache for mermaid diagrams
             self._image_cache = output_dir / "images"
+            self._resolved_images = {}
 
             # Create output path
             # Get title for presentation content
@@ -121,7 +148,7 @@ class PPTXGenerator:
             if "custom_filename" in metadata:
                 filename = metadata["custom_filename"]
             else:
-                filename = title.replace(" ", "_").replace("/", "_")
+                filename = title.translate(_SAFE_TITLE_TABLE)
 
             output_path = output_dir / f"{filename}.pptx"
 
@@ -246,7 +273,7 @@ class PPTXGenerator:
         # Save presentation
         save_presentation(prs, output_path)
 
-        logger.debug(f"Created presentation with {len(prs.slides)} slides")
+        logger.debug("Created presentation with {} slides", len(prs.slides))
 
     def _add_llm_slides(self, prs, slides: list[dict]) -> None:
         """
@@ -257,18 +284,16 @@ class PPTXGenerator:
             slides: List of slide dictionaries with title, bullets, speaker_notes
         Invoked by: (no references found)
         """
-        for slide_data in slides:
-            title = self._strip_inline_markdown(slide_data.get("title", ""))
-            bullets = slide_data.get("bullets", [])
-            speaker_notes = slide_data.get("speaker_notes", "")
+        for spec in map(SlideSpec.from_dict, slides):
+            title = self._strip_inline_markdown(spec.title)
 
-            if title and bullets:
-                normalized = self._expand_bullets(bullets)
+            if title and spec.bullets:
+                normalized = self._expand_bullets(spec.bullets)
                 self._add_bullet_slide_series(
-                    prs, title, normalized, speaker_notes=speaker_notes
+                    prs, title, normalized, speaker_notes=spec.speaker_notes
                 )
 
-        logger.debug(f"Added {len(slides)} LLM-generated slides")
+        logger.debug("Added {} LLM-generated slides", len(slides))
 
     def _add_section_image_slides(self, prs, section_images: dict) -> None:
         """
@@ -299,7 +324,7 @@ class PPTXGenerator:
                 add_image_slide(
                     prs, title, img_path, f"{image_type.title()} for {title}"
                 )
-                logger.debug(f"Added {image_type} slide for section: {title}")
+                logger.debug("Added {} slide for section: {}", image_type, title)
             except Exception as e:
                 logger.warning(f"Failed to add section image slide: {e}")
 
@@ -329,7 +354,7 @@ class PPTXGenerator:
         normalized_root = self._normalize_title(self._strip_inline_markdown(root_title))
         skipped_root_title = False
         current_slide_title = None
-        current_slide_content = []
+        current_slide_content: list[str] = []
         next_section_id = 1
         for kind, content_item in parse_markdown_lines(markdown_content):
             # H1 becomes section header
@@ -344,14 +369,14 @@ class PPTXGenerator:
                 ):
                     skipped_root_title = True
                     current_slide_title = None
-                    current_slide_content = []
+                    current_slide_content.clear()
                     continue
                 # Flush current slide if any
                 if current_slide_title and current_slide_content:
                     self._add_bullet_slide_series(
                         prs, current_slide_title, current_slide_content
                     )
-                    current_slide_content = []
+                    current_slide_content.clear()
 
                 # Add section header
                 add_section_header_slide(prs, content_item)
@@ -384,7 +409,7 @@ class PPTXGenerator:
 
                 # Start new slide
                 current_slide_title = content_item
-                current_slide_content = []
+                current_slide_content.clear()
 
             # H3 becomes content item (if no H2 title yet, becomes title)
             elif kind == "h3":
@@ -395,7 +420,7 @@ class PPTXGenerator:
                     current_slide_content.append(content_item)
                 else:
                     current_slide_title = content_item
-                    current_slide_content = []
+                    current_slide_content.clear()
 
             # Bullets
             elif kind == "bullets":
@@ -413,7 +438,7 @@ class PPTXGenerator:
                     self._add_bullet_slide_series(
                         prs, current_slide_title, current_slide_content
                     )
-                    current_slide_content = []
+                    current_slide_content.clear()
                     current_slide_title = None
 
                 alt, url = content_item
@@ -456,6 +481,10 @@ class PPTXGenerator:
         """
         Resolve image URL to local path.
 
+        Results are memoized per presentation so repeated references to the
+        same image skip the filesystem probes. Identical image bytes are
+        stored once by python-pptx, which deduplicates image parts by hash.
+
         Args:
             url: Image URL or path
 
@@ -463,7 +492,9 @@ class PPTXGenerator:
             Path to local image or None
         Invoked by: src/doc_generator/application/nodes/generate_images.py, src/doc_generator/application/workflow/nodes/generate_images.py, src/doc_generator/infrastructure/generators/pdf/generator.py, src/doc_generator/infrastructure/generators/pptx/generator.py
         """
-        return resolve_image_path(url)
+        if url not in self._resolved_images:
+            self._resolved_images[url] = resolve_image_path(url)
+        return self._resolved_images[url]
 
     def _normalize_section_images(self, section_images: dict) -> dict:
         """
@@ -557,7 +588,7 @@ class PPTXGenerator:
 
                 # Skip duplicate sections
                 if normalized in seen_normalized:
-                    logger.debug(f"Skipping duplicate section: {new_title}")
+                    logger.debug("Skipping duplicate section: {}", new_title)
                     current_title = None  # Don't process this section
                     current_lines = []
                     continue
@@ -604,18 +635,21 @@ class PPTXGenerator:
         Invoked by: src/doc_generator/infrastructure/generators/pptx/generator.py
         """
         # Build slide lookup by normalized title (with and without numbers)
-        slide_map = {}
+        slide_map: dict[str, SlideSpec] = {}
         for slide in slides:
             section_title = slide.get("section_title", slide.get("title", ""))
             if section_title:
+                spec = SlideSpec.from_dict(slide)
                 section_title = self._strip_leading_numbering(
                     self._strip_inline_markdown(section_title)
                 )
                 # Add both normalized and number-stripped versions
-                slide_map[self._normalize_title(section_title)] = slide
-                slide_map[self._normalize_section_title(section_title)] = slide
+                slide_map[self._normalize_title(section_title)] = spec
+                slide_map[self._normalize_section_title(section_title)] = spec
 
-        logger.debug(f"LLM slide map keys: {list(slide_map.keys())[:5]}...")
+        logger.opt(lazy=True).debug(
+            "LLM slide map keys: {}...", lambda: list(slide_map.keys())[:5]
+        )
         slides_added = 0
 
         for section in sections:
@@ -649,8 +683,8 @@ class PPTXGenerator:
             speaker_notes = ""
 
             if slide:
-                bullets = slide.get("bullets", [])
-                speaker_notes = slide.get("speaker_notes", "")
+                bullets = slide.bullets
+                speaker_notes = slide.speaker_notes
 
             # Fallback: extract bullets from section content if LLM didn't provide them
             if not bullets:
@@ -666,7 +700,7 @@ class PPTXGenerator:
             else:
                 logger.warning(f"No content for section: {section_title}")
 
-        logger.info(f"Added {slides_added} content slides from sections")
+        logger.info("Added {} content slides from sections", slides_added)
 
     def _normalize_title(self, title: str) -> str:
         """
@@ -770,7 +804,7 @@ class PPTXGenerator:
             # Normalize to detect duplicates like "Introduction" vs "1. Introduction"
             normalized = self._normalize_section_title(heading)
             if normalized in seen_normalized:
-                logger.debug(f"Skipping duplicate agenda item: {heading}")
+                logger.debug("Skipping duplicate agenda item: {}", heading)
                 continue
 
             seen_normalized.add(normalized)
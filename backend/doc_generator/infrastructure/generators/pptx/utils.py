@@ -36,6 +36,22 @@ TITLE_FONT_NAME = "Georgia"
 BODY_FONT_NAME = "Verdana"
 BULLET_ICONS = ["✓", "★", "◆", "➜", "●", "■"]
 
+# Per-paragraph sizes reused inside the bullet loops
+_BULLET_SIZE = Pt(18)
+_BULLET_SPACE_AFTER = Pt(10)
+_BULLET_LINE_SPACING = Pt(24)
+_BODY_SIZE = Pt(16)
+_BODY_SPACE_AFTER = Pt(8)
+_BODY_LINE_SPACING = Pt(22)
+_SUMMARY_POINT_SIZE = Pt(14)
+
+# Executive summary row geometry; only the row's top offset varies per point
+_SUMMARY_BADGE_LEFT = Inches(0.5)
+_SUMMARY_BADGE_SIZE = Inches(0.35)
+_SUMMARY_POINT_LEFT = Inches(1.0)
+_SUMMARY_POINT_WIDTH = Inches(8.6)
+_SUMMARY_POINT_HEIGHT = Inches(0.6)
+
 
 def _hex_to_rgb(value: str) -> RGBColor:
     """
@@ -157,10 +173,11 @@ def add_title_slide(prs: Presentation, title: str, subtitle: str = "") -> None:
     tf.word_wrap = True
     p = tf.paragraphs[0]
     p.text = title
-    p.font.name = TITLE_FONT_NAME
-    p.font.size = Pt(40)
-    p.font.color.rgb = THEME_COLORS["ink"]
-    p.font.bold = True
+    font = p.font
+    font.name = TITLE_FONT_NAME
+    font.size = Pt(40)
+    font.color.rgb = THEME_COLORS["ink"]
+    font.bold = True
     p.alignment = PP_ALIGN.LEFT
 
     # Subtitle
@@ -173,9 +190,10 @@ def add_title_slide(prs: Presentation, title: str, subtitle: str = "") -> None:
         tf.word_wrap = True
         p = tf.paragraphs[0]
         p.text = subtitle
-        p.font.name = BODY_FONT_NAME
-        p.font.size = Pt(16)
-        p.font.color.rgb = THEME_COLORS["muted"]
+        font = p.font
+        font.name = BODY_FONT_NAME
+        font.size = Pt(16)
+        font.color.rgb = THEME_COLORS["muted"]
         p.alignment = PP_ALIGN.LEFT
 
     # Bottom accent line (left-aligned for corporate look)
@@ -188,7 +206,7 @@ def add_title_slide(prs: Presentation, title: str, subtitle: str = "") -> None:
     bottom_line.fill.fore_color.rgb = THEME_COLORS["teal"]
     bottom_line.line.fill.background()
 
-    logger.debug(f"Added corporate title slide: {title}")
+    logger.debug("Added corporate title slide: {}", title)
 
 
 def add_content_slide(
@@ -239,10 +257,11 @@ def add_content_slide(
     tf.word_wrap = True
     p = tf.paragraphs[0]
     p.text = title
-    p.font.name = TITLE_FONT_NAME
-    p.font.size = Pt(30)
-    p.font.color.rgb = THEME_COLORS["ink"]
-    p.font.bold = True
+    font = p.font
+    font.name = TITLE_FONT_NAME
+    font.size = Pt(30)
+    font.color.rgb = THEME_COLORS["ink"]
+    font.bold = True
 
     # Underline for title
     title_line = slide.shapes.add_shape(
@@ -275,18 +294,20 @@ def add_content_slide(
         if is_bullets:
             icon = BULLET_ICONS[i % len(BULLET_ICONS)]
             p.text = f"{icon} {clean_item}"
-            p.font.name = BODY_FONT_NAME
-            p.font.size = Pt(18)
-            p.font.color.rgb = THEME_COLORS["ink"]
-            p.space_after = Pt(10)
-            p.line_spacing = Pt(24)
+            font = p.font
+            font.name = BODY_FONT_NAME
+            font.size = _BULLET_SIZE
+            font.color.rgb = THEME_COLORS["ink"]
+            p.space_after = _BULLET_SPACE_AFTER
+            p.line_spacing = _BULLET_LINE_SPACING
         else:
             p.text = clean_item
-            p.font.name = BODY_FONT_NAME
-            p.font.size = Pt(16)
-            p.font.color.rgb = THEME_COLORS["muted"]
-            p.space_after = Pt(8)
-            p.line_spacing = Pt(22)
+            font = p.font
+            font.name = BODY_FONT_NAME
+            font.size = _BODY_SIZE
+            font.color.rgb = THEME_COLORS["muted"]
+            p.space_after = _BODY_SPACE_AFTER
+            p.line_spacing = _BODY_LINE_SPACING
 
     # Add speaker notes if provided
     if speaker_notes:
@@ -294,7 +315,7 @@ def add_content_slide(
         notes_tf = notes_slide.notes_text_frame
         notes_tf.text = speaker_notes
 
-    logger.debug(f"Added corporate content slide: {title} ({len(content)} items)")
+    logger.debug("Added corporate content slide: {} ({} items)", title, len(content))
 
 
 def add_section_header_slide(prs: Presentation, section_title: str) -> None:
@@ -344,10 +365,11 @@ def add_section_header_slide(prs: Presentation, section_title: str) -> None:
     tf.word_wrap = True
     p = tf.paragraphs[0]
     p.text = section_title
-    p.font.name = TITLE_FONT_NAME
-    p.font.size = Pt(42)
-    p.font.color.rgb = THEME_COLORS["background"]
-    p.font.bold = True
+    font = p.font
+    font.name = TITLE_FONT_NAME
+    font.size = Pt(42)
+    font.color.rgb = THEME_COLORS["background"]
+    font.bold = True
 
     # Bottom decorative line
     bottom_line = slide.shapes.add_shape(
@@ -359,7 +381,7 @@ def add_section_header_slide(prs: Presentation, section_title: str) -> None:
     bottom_line.fill.fore_color.rgb = THEME_COLORS["teal"]
     bottom_line.line.fill.background()
 
-    logger.debug(f"Added corporate section header: {section_title}")
+    logger.debug("Added corporate section header: {}", section_title)
 
 
 def add_image_slide(
@@ -397,10 +419,11 @@ def add_image_slide(
     text_frame = title_box.text_frame
     p = text_frame.paragraphs[0]
     p.text = title
-    p.font.name = TITLE_FONT_NAME
-    p.font.size = Pt(26)
-    p.font.color.rgb = THEME_COLORS["ink"]
-    p.font.bold = True
+    font = p.font
+    font.name = TITLE_FONT_NAME
+    font.size = Pt(26)
+    font.color.rgb = THEME_COLORS["ink"]
+    font.bold = True
 
     slide_width_in = prs.slide_width / Inches(1)
     slide_height_in = prs.slide_height / Inches(1)
@@ -459,13 +482,14 @@ def add_image_slide(
         text_frame = caption_box.text_frame
         p = text_frame.paragraphs[0]
         p.text = caption
-        p.font.name = BODY_FONT_NAME
-        p.font.size = Pt(14)
-        p.font.color.rgb = THEME_COLORS["muted"]
-        p.font.italic = True
+        font = p.font
+        font.name = BODY_FONT_NAME
+        font.size = Pt(14)
+        font.color.rgb = THEME_COLORS["muted"]
+        font.italic = True
         p.alignment = PP_ALIGN.CENTER
 
-    logger.debug(f"Added image slide: {title}")
+    logger.debug("Added image slide: {}", title)
 
 
 def add_executive_summary_slide(
@@ -508,10 +532,11 @@ def add_executive_summary_slide(
     tf = title_box.text_frame
     p = tf.paragraphs[0]
     p.text = title
-    p.font.name = TITLE_FONT_NAME
-    p.font.size = Pt(28)
-    p.font.color.rgb = THEME_COLORS["ink"]
-    p.font.bold = True
+    font = p.font
+    font.name = TITLE_FONT_NAME
+    font.size = Pt(28)
+    font.color.rgb = THEME_COLORS["ink"]
+    font.bold = True
 
     # Title underline
     title_line = slide.shapes.add_shape(
@@ -529,8 +554,8 @@ def add_executive_summary_slide(
         # Number circle indicator
         num_circle = slide.shapes.add_shape(
             9,  # Oval
-            Inches(0.5), Inches(y_pos),
-            Inches(0.35), Inches(0.35)
+            _SUMMARY_BADGE_LEFT, Inches(y_pos),
+            _SUMMARY_BADGE_SIZE, _SUMMARY_BADGE_SIZE
         )
         num_circle.fill.solid()
         num_circle.fill.fore_color.rgb = THEME_COLORS["accent"]
@@ -538,22 +563,23 @@ def add_executive_summary_slide(
 
         # Number text
         num_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(y_pos + 0.02),
-            Inches(0.35), Inches(0.35)
+            _SUMMARY_BADGE_LEFT, Inches(y_pos + 0.02),
+            _SUMMARY_BADGE_SIZE, _SUMMARY_BADGE_SIZE
         )
         tf = num_box.text_frame
         p = tf.paragraphs[0]
         p.text = f"{i + 1}"
-        p.font.name = BODY_FONT_NAME
-        p.font.size = Pt(16)
-        p.font.color.rgb = THEME_COLORS["background"]
-        p.font.bold = True
+        font = p.font
+        font.name = BODY_FONT_NAME
+        font.size = _BODY_SIZE
+        font.color.rgb = THEME_COLORS["background"]
+        font.bold = True
         p.alignment = PP_ALIGN.CENTER
 
         # Point text
         point_box = slide.shapes.add_textbox(
-            Inches(1.0), Inches(y_pos),
-            Inches(8.6), Inches(0.6)
+            _SUMMARY_POINT_LEFT, Inches(y_pos),
+            _SUMMARY_POINT_WIDTH, _SUMMARY_POINT_HEIGHT
         )
         tf = point_box.text_frame
         tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
@@ -561,11 +587,12 @@ def add_executive_summary_slide(
         p = tf.paragraphs[0]
         clean_point = point.lstrip("•-* ").strip()
         p.text = clean_point
-        p.font.name = BODY_FONT_NAME
-        p.font.size = Pt(14)
-        p.font.color.rgb = THEME_COLORS["ink"]
+        font = p.font
+        font.name = BODY_FONT_NAME
+        font.size = _SUMMARY_POINT_SIZE
+        font.color.rgb = THEME_COLORS["ink"]
 
-    logger.debug(f"Added executive summary slide: {len(summary_points)} points")
+    logger.debug("Added executive summary slide: {} points", len(summary_points))
 
 
 def add_two_column_slide(
@@ -614,10 +641,11 @@ def add_two_column_slide(
     tf = title_box.text_frame
     p = tf.paragraphs[0]
     p.text = title
-    p.font.name = BODY_FONT_NAME
-    p.font.size = Pt(28)
-    p.font.color.rgb = THEME_COLORS["ink"]
-    p.font.bold = True
+    font = p.font
+    font.name = BODY_FONT_NAME
+    font.size = Pt(28)
+    font.color.rgb = THEME_COLORS["ink"]
+    font.bold = True
 
     # Left column title
     if left_title:
@@ -628,10 +656,11 @@ def add_two_column_slide(
         tf = left_title_box.text_frame
         p = tf.paragraphs[0]
         p.text = left_title
-        p.font.name = BODY_FONT_NAME
-        p.font.size = Pt(18)
-        p.font.color.rgb = THEME_COLORS["accent"]
-        p.font.bold = True
+        font = p.font
+        font.name = BODY_FONT_NAME
+        font.size = Pt(18)
+        font.color.rgb = THEME_COLORS["accent"]
+        font.bold = True
 
     # Left column content
     left_box = slide.shapes.add_textbox(
@@ -648,10 +677,11 @@ def add_two_column_slide(
             p = tf.add_paragraph()
         icon = BULLET_ICONS[i % len(BULLET_ICONS)]
         p.text = f"{icon} {item.lstrip('•-* ').strip()}"
-        p.font.name = BODY_FONT_NAME
-        p.font.size = Pt(16)
-        p.font.color.rgb = THEME_COLORS["ink"]
-        p.space_after = Pt(8)
+        font = p.font
+        font.name = BODY_FONT_NAME
+        font.size = _BODY_SIZE
+        font.color.rgb = THEME_COLORS["ink"]
+        p.space_after = _BODY_SPACE_AFTER
 
     # Vertical divider
     divider = slide.shapes.add_shape(
@@ -671,10 +701,11 @@ def add_two_column_slide(
         tf = right_title_box.text_frame
         p = tf.paragraphs[0]
         p.text = right_title
-        p.font.name = BODY_FONT_NAME
-        p.font.size = Pt(18)
-        p.font.color.rgb = THEME_COLORS["teal"]
-        p.font.bold = True
+        font = p.font
+        font.name = BODY_FONT_NAME
+        font.size = Pt(18)
+        font.color.rgb = THEME_COLORS["teal"]
+        font.bold = True
 
     # Right column content
     right_box = slide.shapes.add_textbox(
@@ -691,12 +722,13 @@ def add_two_column_slide(
             p = tf.add_paragraph()
         icon = BULLET_ICONS[i % len(BULLET_ICONS)]
         p.text = f"{icon} {item.lstrip('•-* ').strip()}"
-        p.font.name = BODY_FONT_NAME
-        p.font.size = Pt(16)
-        p.font.color.rgb = THEME_COLORS["ink"]
-        p.space_after = Pt(8)
+        font = p.font
+        font.name = BODY_FONT_NAME
+        font.size = _BODY_SIZE
+        font.color.rgb = THEME_COLORS["ink"]
+        p.space_after = _BODY_SPACE_AFTER
 
-    logger.debug(f"Added two-column slide: {title}")
+    logger.debug("Added two-column slide: {}", title)
 
 
 def save_presentation(prs: Presentation, output_path: Path) -> None:
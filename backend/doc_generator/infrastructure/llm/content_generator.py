@@ -16,6 +16,7 @@ from loguru import logger
 
 from ..observability.opik import log_llm_call
 from ..settings import get_settings
+from .http_client import get_openai_http_client
 from ...domain.prompts.text.content_generator_prompts import (
     build_blog_from_outline_prompt,
     build_chunk_prompt,
@@ -144,7 +145,9 @@ class LLMContentGenerator:
 
         if self.content_provider == "openai":
             if self.openai_api_key and OPENAI_AVAILABLE:
-                self.content_client = OpenAI(api_key=self.openai_api_key)
+                self.content_client = OpenAI(
+                    api_key=self.openai_api_key, http_client=get_openai_http_client()
+                )
                 logger.info(f"Content Generator initialized with OpenAI: {self.content_model}")
             else:
                 logger.warning("OpenAI requested but not available for content generation")
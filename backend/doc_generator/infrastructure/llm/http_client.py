@@ -0,0 +1,58 @@
+"""
+Process-wide HTTP connection pool for OpenAI clients.
+
+LLMService and ContentGenerator build a new OpenAI client per instance
+(often per request, with a caller-supplied API key); sharing one httpx
+pool lets those clients reuse warm TCP/TLS connections.
+"""
+
+import threading
+from typing import Optional
+
+try:
+    import httpx
+    from openai import DefaultHttpxClient
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_MAX_CONNECTIONS = 64
+_MAX_KEEPALIVE_CONNECTIONS = 32
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_openai_http_client() -> Optional["httpx.Client"]:
+    """
+    Get the shared httpx client passed to every OpenAI client.
+
+    Uses HTTP/2 when the h2 package is installed. Request timeouts are
+    left to the OpenAI SDK, which sets them per call.
+
+    Returns:
+        Shared client, or None when httpx/openai are not installed
+    Invoked by: src/doc_generator/infrastructure/llm/content_generator.py, src/doc_generator/infrastructure/llm/service.py
+    """
+    global _http_client
+    if not HTTPX_AVAILABLE:
+        return None
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = DefaultHttpxClient(
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(
+                        max_connections=_MAX_CONNECTIONS,
+                        max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+                    ),
+                )
+    return _http_client
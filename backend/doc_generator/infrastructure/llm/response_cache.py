@@ -0,0 +1,114 @@
+"""
+On-disk cache of LLM responses keyed by prompt hash.
+
+Used by LLMService when `llm.response_cache` is enabled so that repeated
+generations over the same content skip the network round-trip.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+# Responses older than this are ignored on lookup and pruned when the cache opens
+_DEFAULT_TTL_SECONDS = 7 * 86400
+
+
+def response_cache_key(
+    provider: str,
+    model: str,
+    system_msg: str,
+    user_msg: str,
+    max_tokens: int,
+    temperature: float,
+    json_mode: bool,
+) -> bytes:
+    """
+    Build a 16-byte digest identifying one LLM request.
+    Invoked by: src/doc_generator/infrastructure/llm/service.py
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in (provider, model, system_msg, user_msg, max_tokens, temperature, json_mode):
+        raw = str(part).encode()
+        h.update(len(raw).to_bytes(8, "little"))
+        h.update(raw)
+    return h.digest()
+
+
+class LLMResponseCache:
+    """SQLite-backed response store shared by all LLMService instances."""
+
+    def __init__(self, db_path: Path, ttl_seconds: int = _DEFAULT_TTL_SECONDS):
+        """
+        Open (or create) the cache database and prune expired responses.
+
+        Args:
+            db_path: SQLite file path
+            ttl_seconds: Time-to-live for cached responses
+        Invoked by: src/doc_generator/infrastructure/llm/response_cache.py
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(k BLOB PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "DELETE FROM responses WHERE created_at < ?", (time.time() - ttl_seconds,)
+        )
+        self._conn.commit()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Return the cached response for key, if present and not expired.
+        Invoked by: src/doc_generator/infrastructure/llm/service.py
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE k = ? AND created_at >= ?",
+                (key, time.time() - self.ttl_seconds),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: bytes, response: str) -> None:
+        """
+        Store a response, replacing any previous one for key.
+        Invoked by: src/doc_generator/infrastructure/llm/service.py
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (k, response, created_at) VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            self._conn.commit()
+
+
+_response_cache: Optional[LLMResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache(cache_dir: Path) -> Optional[LLMResponseCache]:
+    """
+    Get or open the process-wide response cache under cache_dir.
+
+    Returns:
+        LLMResponseCache, or None if the database cannot be opened
+    Invoked by: src/doc_generator/infrastructure/llm/service.py
+    """
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                try:
+                    _response_cache = LLMResponseCache(Path(cache_dir) / "llm_responses.sqlite")
+                except sqlite3.Error as e:
+                    logger.warning("LLM response cache disabled: {}", e)
+                    return None
+    return _response_cache
@@ -4,8 +4,10 @@ LLM service for intelligent content transformation.
 Provides OpenAI and Claude-powered content summarization, slide generation, and enhancement.
 """
 
+import functools
 import json
 import os
+import threading
 import time
 from typing import Optional
 
@@ -13,7 +15,10 @@ from loguru import logger
 
 from ..settings import get_settings
 from ..observability.opik import log_llm_call
+from .http_client import get_openai_http_client
+from .response_cache import get_response_cache, response_cache_key
 from ...domain.prompts.text.llm_service_prompts import (
+    VISUAL_DATA_FORMATS,
     enhance_bullets_prompt,
     enhance_bullets_system_prompt,
     executive_summary_prompt,
@@ -54,6 +59,59 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
     logger.warning("Anthropic package not available")
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Bullets already within the enhance_bullets_prompt rules (short and
+# action-led) are returned as-is instead of spending a round-trip
+_MAX_BULLET_WORDS = 12
+_ACTION_VERBS = frozenset(
+    """
+    accelerate achieve add adopt align analyze apply assess automate avoid
+    boost build capture centralize clarify close consolidate create cut
+    decrease define deliver deploy design detect develop drive eliminate
+    enable enforce enhance ensure establish evaluate expand expose extend
+    focus grow identify implement improve increase integrate introduce
+    invest launch lead leverage lower maintain manage maximize measure
+    migrate minimize modernize monitor optimize plan prevent prioritize
+    protect reduce refactor remove replace resolve restructure retire
+    scale secure ship simplify stabilize standardize streamline
+    strengthen support track transform unify upgrade use validate
+    """.split()
+)
+
+
+def _bullets_need_enhancement(bullets: list[str]) -> bool:
+    """
+    Check whether any bullet is too long or does not open with an action verb.
+    Invoked by: src/doc_generator/infrastructure/llm/service.py
+    """
+    for bullet in bullets:
+        words = bullet.split()
+        if not words or len(words) > _MAX_BULLET_WORDS:
+            return True
+        if words[0].lower().strip(",.:;") not in _ACTION_VERBS:
+            return True
+    return False
+
+
+def _json_loads(text: str) -> object:
+    """
+    Parse a JSON response, using orjson when installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    catch the same exception either way.
+    Invoked by: src/doc_generator/infrastructure/llm/service.py
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class LLMService:
     """
@@ -63,6 +121,23 @@ class LLMService:
     and executive presentation enhancement.
     """
 
+    __slots__ = (
+        "claude_api_key",
+        "openai_api_key",
+        "gemini_api_key",
+        "model",
+        "client",
+        "provider",
+        "requested_provider",
+        "max_summary_points",
+        "max_slides",
+        "max_tokens_summary",
+        "max_tokens_slides",
+        "temperature_summary",
+        "temperature_slides",
+        "_response_cache",
+    )
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -103,6 +178,13 @@ class LLMService:
         self.temperature_summary = temperature_summary
         self.temperature_slides = temperature_slides
 
+        settings = get_settings()
+        self._response_cache = (
+            get_response_cache(settings.generator.cache_dir)
+            if settings.llm.response_cache
+            else None
+        )
+
         if provider == "gemini":
             if self.gemini_api_key and GENAI_AVAILABLE:
                 self.client = genai.Client(api_key=self.gemini_api_key)
@@ -113,7 +195,9 @@ class LLMService:
                     "Gemini requested but not available - LLM features disabled"
                 )
         elif provider == "openai" and self.openai_api_key and OPENAI_AVAILABLE:
-            self.client = OpenAI(api_key=self.openai_api_key)
+            self.client = OpenAI(
+                api_key=self.openai_api_key, http_client=get_openai_http_client()
+            )
             self.provider = "openai"
             logger.info(f"LLM service initialized with OpenAI: {model}")
         elif provider in ("anthropic", "claude") and self.claude_api_key and ANTHROPIC_AVAILABLE:
@@ -129,6 +213,7 @@ class LLMService:
     _models_used: set[str] = set()
     _providers_used: set[str] = set()
     _call_details: list[dict] = []
+    _usage_lock = threading.Lock()
 
     def is_available(self) -> bool:
         """
@@ -145,6 +230,54 @@ class LLMService:
         temperature: float,
         json_mode: bool = False,
         step: str = "llm_call",
+    ) -> str:
+        """
+        Call LLM provider, consulting the response cache when enabled.
+
+        Retry steps bypass the lookup (the cached answer is what failed) and
+        overwrite the entry with the fresh response.
+
+        Args:
+            system_msg: System message
+            user_msg: User message
+            max_tokens: Maximum tokens
+            temperature: Temperature
+            json_mode: Whether to use JSON mode
+
+        Returns:
+            Response text
+        Invoked by: src/doc_generator/infrastructure/llm/content_generator.py, src/doc_generator/infrastructure/llm/service.py
+        """
+        cache = self._response_cache
+        if cache is None or not self.is_available():
+            return self._call_llm_uncached(
+                system_msg, user_msg, max_tokens, temperature, json_mode, step
+            )
+
+        key = response_cache_key(
+            self.provider, self.model, system_msg, user_msg, max_tokens, temperature, json_mode
+        )
+        if not step.endswith(":retry"):
+            cached = cache.get(key)
+            if cached is not None:
+                logger.debug("LLM response cache hit: step={}", step)
+                return cached
+
+        response_text = self._call_llm_uncached(
+            system_msg, user_msg, max_tokens, temperature, json_mode, step
+        )
+        if response_text:
+            cache.put(key, response_text)
+        return response_text
+
+    def _call_llm_uncached(
+        self,
+        system_msg: str,
+        user_msg: str,
+        max_tokens: int,
+        temperature: float,
+        json_mode: bool = False,
+        step: str = "llm_call",
     ) -> str:
         """
         Call LLM provider (OpenAI or Claude).
@@ -164,7 +297,8 @@ class LLMService:
             return ""
 
         try:
-            LLMService._total_calls += 1
+            with LLMService._usage_lock:
+                LLMService._total_calls += 1
             if self.model:
                 LLMService._models_used.add(self.model)
             if self.provider:
@@ -401,7 +535,7 @@ class LLMService:
         if not text:
             return None
         try:
-            return json.loads(text)
+            return _json_loads(text)
         except json.JSONDecodeError:
             pass
 
@@ -425,7 +559,7 @@ class LLMService:
                 if not stack:
                     candidate = text[start_idx : i + 1]
                     try:
-                        return json.loads(candidate)
+                        return _json_loads(candidate)
                     except json.JSONDecodeError:
                         return None
         return None
@@ -650,7 +784,7 @@ class LLMService:
             Enhanced bullet points
         Invoked by: (no references found)
         """
-        if not self.is_available() or not bullets:
+        if not self.is_available() or not _bullets_need_enhancement(bullets):
             return bullets
 
         prompt = enhance_bullets_prompt(bullets)
@@ -682,7 +816,7 @@ class LLMService:
             Speaker notes text
         Invoked by: (no references found)
         """
-        if not self.is_available():
+        if not self.is_available() or not slide_content:
             return ""
 
         prompt = speaker_notes_prompt(slide_title, slide_content)
@@ -755,13 +889,7 @@ class LLMService:
 
             # Validate and clean visualizations
             valid_visuals = []
-            valid_types = {
-                "architecture",
-                "flowchart",
-                "comparison_visual",
-                "concept_map",
-                "mind_map",
-            }
+            valid_types = VISUAL_DATA_FORMATS.keys()
 
             for visual in visuals[:max_visuals]:
                 if not isinstance(visual, dict):
@@ -797,7 +925,32 @@ class LLMService:
 
 
 # Singleton instance with lazy initialization
-_llm_service: Optional[LLMService] = None
+# Distinct API keys get distinct instances; bounded since keys arrive per request
+_LLM_SERVICE_CACHE_SIZE = 32
+_llm_service_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=_LLM_SERVICE_CACHE_SIZE)
+def _build_llm_service(api_key: Optional[str]) -> LLMService:
+    """
+    Build an LLMService from settings for one API key.
+    Invoked by: src/doc_generator/infrastructure/llm/service.py
+    """
+    settings = get_settings()
+    llm_settings = settings.llm
+    provider = llm_settings.content_provider or "openai"
+    model = llm_settings.content_model or llm_settings.model
+    return LLMService(
+        api_key=api_key,
+        model=model,
+        provider=provider,
+        max_summary_points=llm_settings.max_summary_points,
+        max_slides=llm_settings.max_slides,
+        max_tokens_summary=llm_settings.max_tokens_summary,
+        max_tokens_slides=llm_settings.max_tokens_slides,
+        temperature_summary=llm_settings.temperature_summary,
+        temperature_slides=llm_settings.temperature_slides,
+    )
 
 
 def get_llm_service(api_key: Optional[str] = None) -> LLMService:
@@ -811,21 +964,6 @@ def get_llm_service(api_key: Optional[str] = None) -> LLMService:
         LLMService instance
     Invoked by: scripts/run_generator.py, src/doc_generator/application/nodes/transform_content.py, src/doc_generator/application/workflow/nodes/transform_content.py
     """
-    global _llm_service
-    if _llm_service is None:
-        settings = get_settings()
-        llm_settings = settings.llm
-        provider = llm_settings.content_provider or "openai"
-        model = llm_settings.content_model or llm_settings.model
-        _llm_service = LLMService(
-            api_key=api_key,
-            model=model,
-            provider=provider,
-            max_summary_points=llm_settings.max_summary_points,
-            max_slides=llm_settings.max_slides,
-            max_tokens_summary=llm_settings.max_tokens_summary,
-            max_tokens_slides=llm_settings.max_tokens_slides,
-            temperature_summary=llm_settings.temperature_summary,
-            temperature_slides=llm_settings.temperature_slides,
-        )
-    return _llm_service
+    # The lock keeps concurrent first use from building two instances
+    with _llm_service_lock:
+        return _build_llm_service(api_key)
@@ -109,12 +109,13 @@ def setup_logging(verbose: bool = False, log_file: str | None = None) -> None:
         "<level>{message}</level>"
     )
 
-    # Console logging with color
+    # Console logging with color when attached to a terminal; redirected
+    # output (containers, log files) skips the ANSI escape rendering
     logger.add(
         sys.stderr,
         level=level,
         format=console_format,
-        colorize=True,
+        colorize=None,
     )
 
     # File logging if requested
@@ -10,6 +10,9 @@ from loguru import logger
 
 from ...domain.exceptions import FileNotFoundError as PrismDocsFileNotFoundError
 
+_READ_BUFFER_SIZE = 1 << 20
+_UTF8_BOM = b"\xef\xbb\xbf"
+
 
 def ensure_directory(directory: Path) -> None:
     """
@@ -89,6 +92,12 @@ def read_text_file(file_path: Path, encoding: str = "utf-8") -> str:
     """
     Read text file content.
 
+    The file is read as bytes through a large buffer and decoded once.
+    Line endings are normalized to LF, matching text-mode reads. Unlike a
+    text-mode read, a leading UTF-8 byte order mark is deliberately
+    stripped so U+FEFF never reaches callers (frontmatter detection,
+    prompts).
+
     Args:
         file_path: Path to text file
         encoding: File encoding
@@ -104,7 +113,13 @@ def read_text_file(file_path: Path, encoding: str = "utf-8") -> str:
     validate_file_exists(file_path)
 
     try:
-        content = file_path.read_text(encoding=encoding)
+        with open(file_path, "rb", buffering=_READ_BUFFER_SIZE) as handle:
+            data = handle.read()
+        if encoding.replace("-", "").lower() == "utf8":
+            data = data.removeprefix(_UTF8_BOM)
+        content = data.decode(encoding)
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
         logger.debug(f"Read {len(content)} characters from {file_path.name}")
         return content
     except UnicodeDecodeError as e:
@@ -205,6 +205,10 @@ class LlmSettings(BaseSettings):
     temperature_summary: float = 0.3
     temperature_slides: float = 0.4
 
+    # Persist responses in cache_dir keyed by prompt hash (for iterative runs;
+    # identical prompts then return identical output)
+    response_cache: bool = False
+
     # Legacy Claude settings (for backwards compatibility)
     claude_model: str = "claude-sonnet-4-20250514"
     claude_max_tokens: int = 4000
@@ -1,7 +1,9 @@
 """Storage service for uploads and outputs."""
 
 import secrets
+import shutil
 import time
+from collections import OrderedDict
 from pathlib import Path
 
 from loguru import logger
@@ -27,12 +29,14 @@ class StorageService:
         base_output_dir: Path | None = None,
         cache_dir: Path | None = None,
         base_url: str = "/api/download",
+        max_uploads: int = 10000,
     ):
         """Initialize storage service.
 
         Args:
             base_output_dir: Base directory for all outputs
             base_url: Base URL for download links
+            max_uploads: Upload metadata entries kept in memory (LRU)
         Invoked by: (no references found)
         """
         settings = get_settings()
@@ -44,13 +48,17 @@ class StorageService:
         self.base_output_dir = Path(base_output_dir)
         self.cache_dir = Path(cache_dir)
         self.base_url = base_url
+        self.max_uploads = max_uploads
 
         # Ensure base directories exist
         self.base_output_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Track upload metadata
-        self._uploads: dict[str, dict] = {}
+        # Track upload metadata (LRU order, bounded by max_uploads)
+        self._uploads: OrderedDict[str, dict] = OrderedDict()
+        # created_at of uploads whose metadata was evicted, so the TTL sweep
+        # still removes their directories
+        self._evicted_uploads: dict[str, float] = {}
 
     def _get_file_dir(self, file_id: str) -> Path:
         """
@@ -117,6 +125,11 @@ class StorageService:
             "dirs": dirs,
             "created_at": time.time(),
         }
+        # Only the metadata is evicted; files stay on disk and are found
+        # again by get_upload_path
+        while len(self._uploads) > self.max_uploads:
+            evicted_id, evicted = self._uploads.popitem(last=False)
+            self._evicted_uploads[evicted_id] = evicted["created_at"]
 
         return file_id
 
@@ -134,6 +147,7 @@ class StorageService:
         Invoked by: src/doc_generator/infrastructure/api/services/generation.py, src/doc_generator/infrastructure/storage/file_storage.py, tests/api/test_storage_service.py
         """
         if file_id in self._uploads:
+            self._uploads.move_to_end(file_id)
             return self._uploads[file_id]["path"]
 
         # Try to find on disk if not in memory (after server restart)
@@ -157,6 +171,7 @@ class StorageService:
         Invoked by: src/doc_generator/infrastructure/storage/file_storage.py
         """
         if file_id in self._uploads:
+            self._uploads.move_to_end(file_id)
             return self._uploads[file_id]["dirs"]
 
         # Recreate dirs structure if needed
@@ -224,6 +239,7 @@ class StorageService:
                 }
             except FileNotFoundError:
                 raise FileNotFoundError(f"Upload not found: {file_id}")
+        self._uploads.move_to_end(file_id)
         return self._uploads[file_id].copy()
 
     def get_download_url(self, output_path: Path) -> str:
@@ -265,10 +281,9 @@ class StorageService:
             file_id: File ID to remove
         Invoked by: src/doc_generator/infrastructure/storage/file_storage.py, tests/api/test_storage_service.py
         """
-        import shutil
-
         if file_id in self._uploads:
             del self._uploads[file_id]
+        self._evicted_uploads.pop(file_id, None)
 
         file_dir = self._get_file_dir(file_id)
         if file_dir.exists():
@@ -285,16 +300,30 @@ class StorageService:
             Number of files cleaned up
         Invoked by: (no references found)
         """
-        now = time.time()
-        expired = []
-
-        for file_id, metadata in self._uploads.items():
-            if now - metadata["created_at"] > max_age_seconds:
-                expired.append(file_id)
-
+        cutoff = time.time() - max_age_seconds
+        expired = [
+            file_id
+            for file_id, metadata in self._uploads.items()
+            if metadata["created_at"] < cutoff
+        ]
+        expired_evicted = [
+            file_id
+            for file_id, created_at in self._evicted_uploads.items()
+            if created_at < cutoff
+        ]
+
+        # Batch the sweep: drop metadata first, then remove each directory
+        # without a separate exists() stat, and log once for the whole batch
+        for file_id in expired:
+            del self._uploads[file_id]
+        for file_id in expired_evicted:
+            del self._evicted_uploads[file_id]
+        expired.extend(expired_evicted)
         for file_id in expired:
-            self.cleanup_upload(file_id)
+            shutil.rmtree(self._get_file_dir(file_id), ignore_errors=True)
 
+        if expired:
+            logger.info("Cleaned up {} expired uploads", len(expired))
         return len(expired)
 
     # Legacy compatibility properties
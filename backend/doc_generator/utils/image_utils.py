@@ -4,6 +4,8 @@ Shared image utilities for document generator.
 Contains common image path resolution used across PDF and PPTX generators.
 """
 
+import os
+import stat
 from pathlib import Path
 from typing import Optional
 
@@ -45,7 +47,12 @@ def resolve_image_path(
     ]
 
     for candidate in candidates:
-        if candidate.exists() and candidate.is_file():
+        # Single stat() per candidate instead of exists() + is_file()
+        try:
+            st = os.stat(candidate)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
             return candidate
 
     logger.warning(f"Image not found: {url}")
@@ -6,6 +6,11 @@ Contains common markdown processing functions used across parsers and generators
 
 import re
 
+_FRONTMATTER_RE = re.compile(r"\A---\r?\n(?P<fm>.*?)\r?\n---(?:\r?\n|\Z)", re.DOTALL)
+_FRONTMATTER_PREFIXES = ("---\n", "---\r\n")
+_FRONTMATTER_KEYS = frozenset({"title", "author", "date"})
+_LEADING_SPACE_RE = re.compile(r"\s*")
+
 
 def strip_frontmatter(text: str) -> str:
     """
@@ -27,6 +32,67 @@ def strip_frontmatter(text: str) -> str:
     return text
 
 
+def extract_and_strip_frontmatter(text: str) -> tuple[dict, str]:
+    """
+    Extract frontmatter metadata and strip it from markdown in one pass.
+
+    A single anchored match captures the frontmatter block; the body is the
+    remainder after the match, so the text is never rescanned or split.
+
+    Args:
+        text: Markdown text potentially containing frontmatter
+
+    Returns:
+        Tuple of (metadata, text with frontmatter removed)
+    Invoked by: src/doc_generator/application/parsers/markdown_parser.py
+    """
+    metadata, body_start = locate_frontmatter(text)
+    return metadata, text[body_start:] if body_start else text
+
+
+def locate_frontmatter(text: str) -> tuple[dict, int]:
+    """
+    Parse the frontmatter block and find where the body starts.
+
+    Args:
+        text: Markdown text potentially containing frontmatter
+
+    Returns:
+        Tuple of (metadata, index of the body after leading whitespace);
+        the index is 0 when there is no frontmatter
+    Invoked by: src/doc_generator/application/parsers/markdown_parser.py, src/doc_generator/utils/markdown_utils.py
+    """
+    # Cheap prefix check so documents without frontmatter skip the regex
+    if not text.startswith(_FRONTMATTER_PREFIXES):
+        return {}, 0
+
+    frontmatter_match = _FRONTMATTER_RE.match(text)
+    if not frontmatter_match:
+        return {}, 0
+
+    metadata = _parse_frontmatter_fields(frontmatter_match.group("fm"))
+    return metadata, _LEADING_SPACE_RE.match(text, frontmatter_match.end()).end()
+
+
+def _parse_frontmatter_fields(fm_text: str) -> dict:
+    """
+    Parse the simple YAML keys (title, author, date) from a frontmatter block.
+    Invoked by: src/doc_generator/utils/markdown_utils.py
+    """
+    metadata = {}
+
+    # Simple YAML parsing (title, author, date); first occurrence wins
+    for line in fm_text.splitlines():
+        key, sep, value = line.partition(":")
+        if not sep or key not in _FRONTMATTER_KEYS or key in metadata:
+            continue
+        value = value.strip()
+        if value:
+            metadata[key] = value.strip('"\'')
+
+    return metadata
+
+
 def extract_frontmatter(text: str) -> dict:
     """
     Extract YAML frontmatter metadata from markdown text.
@@ -38,25 +104,13 @@ def extract_frontmatter(text: str) -> dict:
         Dictionary of metadata from frontmatter
     Invoked by: src/doc_generator/application/parsers/markdown_parser.py
     """
-    metadata = {}
+    if not text.startswith(_FRONTMATTER_PREFIXES):
+        return {}
 
     # Check for frontmatter
-    frontmatter_match = re.match(r"^---\n(.*?)\n---\n", text, re.DOTALL)
+    frontmatter_match = _FRONTMATTER_RE.match(text)
 
     if frontmatter_match:
-        fm_text = frontmatter_match.group(1)
+        return _parse_frontmatter_fields(frontmatter_match.group("fm"))
 
-        # Simple YAML parsing (title, author, date)
-        title_match = re.search(r"title:\s*(.+)", fm_text)
-        if title_match:
-            metadata["title"] = title_match.group(1).strip('"\'')
-
-        author_match = re.search(r"author:\s*(.+)", fm_text)
-        if author_match:
-            metadata["author"] = author_match.group(1).strip('"\'')
-
-        date_match = re.search(r"date:\s*(.+)", fm_text)
-        if date_match:
-            metadata["date"] = date_match.group(1).strip('"\'')
-
-    return metadata
+    return {}
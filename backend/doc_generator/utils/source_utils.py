@@ -11,6 +11,9 @@ from ..domain.content_types import ContentFormat
 from ..infrastructure.settings import get_settings
 from ..application.unified_state import UnifiedWorkflowState
 
+# Chars encoded and written per chunk; bounds the extra memory of the write
+_WRITE_CHUNK_CHARS = 1 << 20
+
 
 def coerce_source_dict(source: object) -> dict:
     """Normalize source models (dict or Pydantic) into a plain dict."""
@@ -94,6 +97,9 @@ def write_temp_markdown(content: str) -> Path:
     temp_dir = settings.generator.temp_dir
     temp_dir.mkdir(parents=True, exist_ok=True)
     temp_path = temp_dir / f"temp_input_{uuid.uuid4().hex}.md"
-    temp_path.write_text(content, encoding="utf-8")
+    # Encode and write in slices so a large merge is never duplicated as bytes
+    with open(temp_path, "w", encoding="utf-8", buffering=_WRITE_CHUNK_CHARS) as f:
+        for start in range(0, len(content), _WRITE_CHUNK_CHARS):
+            f.write(content[start:start + _WRITE_CHUNK_CHARS])
     logger.info(f"Created temp input file: {temp_path}")
     return temp_path
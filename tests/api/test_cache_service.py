@@ -35,7 +35,7 @@ class TestCacheService:
             ),
         )
         key = cache_service.generate_cache_key(request)
-        assert len(key) == 64  # SHA256 hex digest
+        assert len(key) == 43  # SHA256 digest, unpadded URL-safe base64
 
     def test_same_request_same_key(self, cache_service):
         """
@@ -104,3 +104,45 @@ class TestCacheService:
         result = cache_service.get(request)
         assert result is not None
         assert result["metadata"]["title"] == "Test Doc"
+
+    def test_regenerated_output_does_not_touch_identical_outputs(self, cache_service, tmp_path):
+        """
+        Invoked by: (no references found)
+        """
+        first = tmp_path / "a" / "doc.pdf"
+        second = tmp_path / "b" / "doc.pdf"
+        for path in (first, second):
+            path.parent.mkdir()
+            path.write_bytes(b"%PDF identical bytes")
+
+        for path, content in ((first, "A"), (second, "B")):
+            request = GenerateRequest(
+                output_format=OutputFormat.PDF,
+                sources=SourceCategories(primary=[TextSource(content=content)]),
+            )
+            cache_service.set(request=request, output_path=path, metadata={})
+
+        # Generators rewrite outputs in place ("wb" truncates the inode)
+        with open(first, "wb") as f:
+            f.write(b"%PDF regenerated")
+
+        assert second.read_bytes() == b"%PDF identical bytes"
+        assert first.stat().st_nlink == 1
+        assert second.stat().st_nlink == 1
+
+    def test_clear_all_drops_memory_entries(self, cache_service):
+        """
+        Invoked by: (no references found)
+        """
+        request = GenerateRequest(
+            output_format=OutputFormat.PDF,
+            sources=SourceCategories(primary=[TextSource(content="Test")]),
+        )
+        cache_service.set(
+            request=request,
+            output_path=Path("/output/doc.pdf"),
+            metadata={"title": "Test Doc"},
+        )
+        assert cache_service.clear_all() == {"cleared_cache_entries": 1}
+        assert cache_service.get(request) is None
+        assert cache_service.get_stats()["cache_entries"] == 0
@@ -0,0 +1,70 @@
+"""Tests for the markdown file parser."""
+
+import pytest
+
+from doc_generator.application.parsers.markdown_parser import MarkdownParser
+from doc_generator.domain.exceptions import ParseError
+
+
+@pytest.fixture
+def parser():
+    """
+    Create markdown parser.
+    Invoked by: tests/application/test_markdown_parser.py
+    """
+    return MarkdownParser()
+
+
+class TestMarkdownParser:
+    """Test markdown parsing and frontmatter handling."""
+
+    def test_frontmatter_is_extracted(self, parser, tmp_path):
+        """
+        Invoked by: (no references found)
+        """
+        path = tmp_path / "doc.md"
+        path.write_bytes(b'---\ntitle: "My Doc"\nauthor: Me\n---\n\n# Heading\nBody\n')
+        content, metadata = parser.parse(path)
+        assert content == "# Heading\nBody\n"
+        assert metadata["title"] == "My Doc"
+        assert metadata["author"] == "Me"
+
+    def test_crlf_is_normalized(self, parser, tmp_path):
+        """
+        Invoked by: (no references found)
+        """
+        path = tmp_path / "doc.md"
+        path.write_bytes(b"\xef\xbb\xbf---\r\ntitle: T\r\n---\r\n\r\nLine 1\r\nLine 2\r")
+        content, metadata = parser.parse(path)
+        assert content == "Line 1\nLine 2\n"
+        assert metadata["title"] == "T"
+
+    def test_frontmatter_longer_than_header_chunk(self, parser, tmp_path):
+        """
+        Invoked by: (no references found)
+        """
+        path = tmp_path / "doc.md"
+        filler = "".join(f"note{i}: value\n" for i in range(1000))
+        path.write_text(f"---\ntitle: Long\n{filler}---\nBody\n", encoding="utf-8")
+        content, metadata = parser.parse(path)
+        assert content == "Body\n"
+        assert metadata["title"] == "Long"
+
+    def test_without_frontmatter_uses_file_stem(self, parser, tmp_path):
+        """
+        Invoked by: (no references found)
+        """
+        path = tmp_path / "notes.md"
+        path.write_text("  # Heading\n", encoding="utf-8")
+        content, metadata = parser.parse(path)
+        assert content == "  # Heading\n"
+        assert metadata["title"] == "notes"
+
+    def test_invalid_utf8_raises_parse_error(self, parser, tmp_path):
+        """
+        Invoked by: (no references found)
+        """
+        path = tmp_path / "doc.md"
+        path.write_bytes(b"# Heading\n\xff\xfe broken\n")
+        with pytest.raises(ParseError):
+            parser.parse(path)
@@ -0,0 +1,63 @@
+"""Tests for LLM service prompt helpers."""
+
+import random
+
+from doc_generator.domain.prompts.text.llm_service_prompts import _compact
+
+WORDS = ["alpha", "beta", "gamma", "delta", "lorem", "ipsum", "x"]
+
+
+class TestCompact:
+    """Test prompt content compaction."""
+
+    def test_stays_within_limit(self):
+        """
+        Invoked by: (no references found)
+        """
+        rng = random.Random(0)
+        for _ in range(5000):
+            paragraphs = [
+                " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 30)))
+                for _ in range(rng.randint(0, 15))
+            ]
+            limit = rng.randint(0, 400)
+            assert len(_compact("\n\n".join(paragraphs), limit)) <= limit
+
+    def test_short_content_is_unchanged(self):
+        """
+        Invoked by: (no references found)
+        """
+        content = "First paragraph.\n\nSecond paragraph."
+        assert _compact(content, 8000) == content
+
+    def test_under_limit_keeps_repeated_labels(self):
+        """
+        Invoked by: (no references found)
+        """
+        content = (
+            "## Option A\n\n**Pros:**\n\n- fast\n\n**Cons:**\n\n- costly\n\n"
+            "## Option B\n\n**Pros:**\n\n- cheap\n\n**Cons:**\n\n- slow"
+        )
+        assert _compact(content, 8000) == content
+
+    def test_over_limit_drops_repeated_boilerplate_only(self):
+        """
+        Invoked by: (no references found)
+        """
+        boilerplate = "Copyright notice: " + "all rights reserved " * 5
+        content = "\n\n".join(
+            ["Intro", boilerplate, "**Pros:**", "- fast", boilerplate, "**Pros:**", "- cheap", "End"]
+        )
+        result = _compact(content, len(content) - 1)
+        assert result.count(boilerplate) == 1
+        assert result.count("**Pros:**") == 2
+
+    def test_keeps_first_and_last_paragraphs(self):
+        """
+        Invoked by: (no references found)
+        """
+        middle = [f"filler {i} " + "word " * 40 for i in range(20)]
+        content = "\n\n".join(["Intro", *middle, "Conclusion"])
+        result = _compact(content, 500)
+        assert result.startswith("Intro\n\n")
+        assert result.endswith("\n\nConclusion")
@@ -0,0 +1,99 @@
+"""Tests for the markdown helpers shared by the PDF and PPTX generators."""
+
+import random
+import re
+
+import pytest
+
+from doc_generator.infrastructure import pdf_utils
+from doc_generator.infrastructure.generators.pdf import utils as pdf_generator_utils
+
+# The link pattern _sub_links replaced
+LINK_RE = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)")
+
+
+@pytest.fixture(params=[pdf_generator_utils, pdf_utils], ids=["generators.pdf.utils", "pdf_utils"])
+def utils_module(request):
+    """
+    Both parser copies must behave identically.
+    Invoked by: tests/infrastructure/test_pdf_markdown_utils.py
+    """
+    return request.param
+
+
+def _random_text(rng: random.Random, alphabet: str, max_len: int) -> str:
+    """
+    Build a random string over alphabet.
+    Invoked by: tests/infrastructure/test_pdf_markdown_utils.py
+    """
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_len)))
+
+
+class TestSubLinks:
+    """Test the linear-time link scanner."""
+
+    def test_matches_link_regex(self, utils_module):
+        """
+        Invoked by: (no references found)
+        """
+        rng = random.Random(0)
+        for _ in range(20000):
+            text = _random_text(rng, "[]()ab ", 16)
+            expected = LINK_RE.sub(lambda m: f"<{m.group(1)}|{m.group(2)}>", text)
+            assert utils_module._sub_links(text, lambda t, u: f"<{t}|{u}>") == expected, text
+
+    def test_replaces_links_in_order(self, utils_module):
+        """
+        Invoked by: (no references found)
+        """
+        text = "See [docs](http://a) and [code](http://b)."
+        assert (
+            utils_module._sub_links(text, lambda t, u: f"{t}@{u}")
+            == "See docs@http://a and code@http://b."
+        )
+
+    def test_unclosed_brackets_are_left_alone(self, utils_module):
+        """
+        Invoked by: (no references found)
+        """
+        text = "[a](" * 1000
+        assert utils_module._sub_links(text, lambda t, u: "x") == text
+
+
+class TestIterLines:
+    """Test the lazy line splitter."""
+
+    def test_matches_splitlines(self, utils_module):
+        """
+        Invoked by: (no references found)
+        """
+        rng = random.Random(0)
+        alphabet = "ab \r\n\v\f\x1c\x1d\x1e\x85  "
+        for _ in range(20000):
+            text = _random_text(rng, alphabet, 12)
+            assert list(utils_module._iter_lines(text)) == text.splitlines(), repr(text)
+
+
+class TestBulletDetection:
+    """Test bullet parsing in parse_markdown_lines."""
+
+    @pytest.mark.parametrize(
+        "line,expected",
+        [
+            ("- item", [("bullets", ["item"])]),
+            ("*\titem", [("bullets", ["item"])]),
+            ("-  spaced", [("bullets", ["spaced"])]),
+        ],
+    )
+    def test_bullets(self, utils_module, line, expected):
+        """
+        Invoked by: (no references found)
+        """
+        assert list(utils_module.parse_markdown_lines(line)) == expected
+
+    def test_marker_without_space_is_not_a_bullet(self, utils_module):
+        """
+        Invoked by: (no references found)
+        """
+        blocks = list(utils_module.parse_markdown_lines("-item"))
+        assert all(kind != "bullets" for kind, _ in blocks)